@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 from dataclasses import dataclass
 from typing import Any, Mapping
 
+try:  # 可选加速依赖：orjson（解析比 stdlib json 快数倍，缺失时自动回退）
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 def _require_dict(value: Any, *, where: str) -> Mapping[str, Any]:
     if not isinstance(value, dict):
@@ -54,12 +60,15 @@ class GitHubSourceConfig:
       - 是否分别监控 Issues / Pull Requests
     token_env:
       - GitHub Token 的环境变量名（可选，不配置则匿名访问，易触发限流）
+    token:
+      - 加载配置时从 token_env 解析出的实际 token（热路径直接读字段，不再查 os.environ）
     """
 
     repos: tuple[str, ...]
     monitor_issues: bool
     monitor_pulls: bool
     token_env: str | None
+    token: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -70,6 +79,7 @@ class HuggingFaceSourceConfig:
 
     orgs: tuple[str, ...]
     token_env: str | None
+    token: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -95,6 +105,7 @@ class WeLinkNotifyConfig:
     """
 
     webhook_env: str
+    webhook_url: str | None = None
     is_at: bool = False
     is_at_all: bool = False
     at_accounts: tuple[str, ...] = ()
@@ -112,6 +123,8 @@ class EmailNotifyConfig:
     password_env: str
     to_list: tuple[str, ...]
     use_tls: bool = True
+    username: str = ""
+    password: str = ""
 
 
 @dataclass(frozen=True, slots=True)
@@ -137,6 +150,10 @@ class AppConfig:
     email: EmailNotifyConfig | None
 
     def resolve_env(self, env_name: str | None) -> str | None:
+        """
+        兼容保留：env 变量现已在 load_config 阶段一次性解析到各配置字段，
+        热路径不再需要逐周期查询 os.environ。
+        """
         if not env_name:
             return None
         return os.environ.get(env_name)
@@ -154,10 +171,28 @@ def load_config(config_path: str) -> AppConfig:
       "sources": { ... },
       "notify": { ... }
     }
+
+    按 (路径, mtime_ns) 做 LRU 缓存：周期性重载时文件未变化即零解析成本，
+    文件一旦被改写（mtime 变化）缓存自动失效。AppConfig 是 frozen dataclass，
+    跨调用共享同一实例是安全的。
     """
+    return _load_config_cached(config_path, os.stat(config_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, _mtime_ns: int) -> AppConfig:
     with open(config_path, "rb") as f:
-        raw = json.loads(f.read().decode("utf-8"))
+        data = f.read()
+    raw = orjson.loads(data) if orjson is not None else json.loads(data.decode("utf-8"))
+    return load_config_from_dict(raw)
 
+
+def load_config_from_dict(raw: Any) -> AppConfig:
+    """
+    从已解析的 dict 构建 AppConfig（load_config 的落盘无关版本）。
+
+    测试与嵌入场景可直接传 dict，免去临时文件写盘与重新解析。
+    """
     root = _require_dict(raw, where="$")
     poll_interval_seconds = _get_int(root, "poll_interval_seconds", 300)
     watch_keywords = tuple(_get_str_list(root, "watch_keywords", []))
@@ -172,19 +207,23 @@ def load_config(config_path: str) -> AppConfig:
         gh = _require_dict(sources["github"], where="$.sources.github")
         repos = tuple(_get_str_list(gh, "repos", []))
         monitor = _require_dict(gh.get("monitor", {}), where="$.sources.github.monitor")
+        gh_token_env = _get_str(gh, "token_env", None)
         github_cfg = GitHubSourceConfig(
             repos=repos,
             monitor_issues=_get_bool(monitor, "issues", True),
             monitor_pulls=_get_bool(monitor, "pulls", True),
-            token_env=_get_str(gh, "token_env", None),
+            token_env=gh_token_env,
+            token=os.environ.get(gh_token_env) if gh_token_env else None,
         )
 
     hf_cfg: HuggingFaceSourceConfig | None = None
     if isinstance(sources.get("huggingface"), dict):
         hf = _require_dict(sources["huggingface"], where="$.sources.huggingface")
+        hf_token_env = _get_str(hf, "token_env", None)
         hf_cfg = HuggingFaceSourceConfig(
             orgs=tuple(_get_str_list(hf, "orgs", [])),
-            token_env=_get_str(hf, "token_env", None),
+            token_env=hf_token_env,
+            token=os.environ.get(hf_token_env) if hf_token_env else None,
         )
 
     ms_cfg: ModelScopeSourceConfig | None = None
@@ -201,6 +240,7 @@ def load_config(config_path: str) -> AppConfig:
         at_accounts = tuple(_get_str_list(wl, "at_accounts", []))
         welink_cfg = WeLinkNotifyConfig(
             webhook_env=webhook_env,
+            webhook_url=os.environ.get(webhook_env),
             is_at=_get_bool(wl, "is_at", bool(at_accounts)),
             is_at_all=_get_bool(wl, "is_at_all", False),
             at_accounts=at_accounts,
@@ -210,13 +250,17 @@ def load_config(config_path: str) -> AppConfig:
     if isinstance(notify.get("email"), dict):
         em = _require_dict(notify["email"], where="$.notify.email")
         to_list = tuple(_get_str_list(em, "to_list", []))
+        user_env = str(em.get("user_env") or "")
+        password_env = str(em.get("password_env") or "")
         email_cfg = EmailNotifyConfig(
             smtp_host=str(em.get("smtp_host") or ""),
             smtp_port=_get_int(em, "smtp_port", 587),
-            user_env=str(em.get("user_env") or ""),
-            password_env=str(em.get("password_env") or ""),
+            user_env=user_env,
+            password_env=password_env,
             to_list=to_list,
             use_tls=_get_bool(em, "use_tls", True),
+            username=os.environ.get(user_env) or "" if user_env else "",
+            password=os.environ.get(password_env) or "" if password_env else "",
         )
 
     return AppConfig(
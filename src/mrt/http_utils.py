@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+import functools
+import gzip
 import json
 import random
+import re
 import ssl
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Mapping
 
+try:  # 可选加速依赖：orjson（直接吃 bytes，免去 UTF-8 预解码，解析快数倍）
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:  # 可选加速依赖：requests（Session 提供 keep-alive 连接池，缺失时回退 urllib）
+    import requests
+except ImportError:  # pragma: no cover
+    requests = None  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=2)
+def _ssl_ctx(verify: bool) -> ssl.SSLContext:
+    """
+    进程级共享 SSLContext。create_default_context 每次都要重新解析系统
+    CA bundle（数百 KB PEM），按 verify 取值缓存后，多个 HttpClient/测试
+    实例只付一次解析成本。
+    """
+    return ssl.create_default_context() if verify else ssl._create_unverified_context()
+
 
 @dataclass(frozen=True, slots=True)
 class HttpResponse:
@@ -22,6 +46,8 @@ class HttpResponse:
         return self.body.decode(encoding, errors="replace")
 
     def json(self) -> Any:
+        if orjson is not None:
+            return orjson.loads(self.body)
         return json.loads(self.body.decode("utf-8"))
 
 
@@ -32,6 +58,8 @@ class HttpClient:
     v0 策略：
     - 对 429/5xx 做有限次退避重试
     - 统一超时、User-Agent
+    - 若安装了 requests，则复用 Session 连接池（keep-alive），
+      避免每次轮询都重付 DNS+TCP+TLS 握手；未安装时回退 urllib 单次请求
     """
 
     def __init__(
@@ -47,28 +75,172 @@ class HttpClient:
         self._user_agent = user_agent
         self._max_retries = max_retries
         self._base_backoff_seconds = base_backoff_seconds
-        self._ssl_context = ssl.create_default_context() if verify_ssl else ssl._create_unverified_context()
+        self._verify_ssl = verify_ssl
+        self._ssl_context = _ssl_ctx(verify_ssl)
+
+        # ETag 缓存（URL -> ETag）：GitHub 等 API 对带 If-None-Match 的未变更请求
+        # 返回 304 且不计入限流，省掉响应体与 JSON 解析。dict 读写在 CPython 下
+        # 是原子的，并发拉取线程共享无需加锁。
+        self._etag_cache: dict[str, str] = {}
+
+        self._session = None
+        if requests is not None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
 
     @property
     def ssl_context(self) -> ssl.SSLContext:
         return self._ssl_context
 
+    def close(self) -> None:
+        """关闭连接池；之后的请求走 urllib 单次连接。"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def get(self, url: str, *, headers: Mapping[str, str] | None = None) -> HttpResponse:
         request_headers = {"User-Agent": self._user_agent}
         if headers:
             request_headers.update(dict(headers))
 
+        etag = self._etag_cache.get(url)
+        if etag and "If-None-Match" not in request_headers:
+            request_headers["If-None-Match"] = etag
+
         last_error: Exception | None = None
         for attempt in range(self._max_retries + 1):
+            if self._session is not None:
+                try:
+                    r = self._session.get(
+                        url,
+                        headers=request_headers,
+                        timeout=self._timeout_seconds,
+                        verify=self._verify_ssl,
+                    )
+                except requests.RequestException as e:
+                    last_error = e
+                    if attempt >= self._max_retries:
+                        raise
+                else:
+                    if r.status_code in (429, 500, 502, 503, 504) and attempt < self._max_retries:
+                        last_error = RuntimeError(f"HTTP {r.status_code}: {url}")
+                    else:
+                        r.raise_for_status()
+                        new_etag = r.headers.get("ETag")
+                        if new_etag:
+                            self._etag_cache[url] = new_etag
+                        return HttpResponse(
+                            status=r.status_code,
+                            url=str(r.url),
+                            headers=dict(r.headers),
+                            body=r.content,
+                        )
+                backoff = self._base_backoff_seconds * (2**attempt)
+                jitter = random.random() * 0.25 * backoff
+                time.sleep(backoff + jitter)
+                continue
+
             try:
+                # urllib 不会自动协商压缩；JSON 文本 gzip 后通常缩小 5~10 倍，
+                # 瓶颈在线上字节数而非解压 CPU。requests 分支由 Session 自行处理。
+                request_headers.setdefault("Accept-Encoding", "gzip")
                 req = urllib.request.Request(url=url, headers=request_headers, method="GET")
                 with urllib.request.urlopen(req, timeout=self._timeout_seconds, context=self._ssl_context) as resp:
                     resp_headers = {k: v for k, v in resp.headers.items()}
+                    new_etag = resp_headers.get("ETag")
+                    if new_etag:
+                        self._etag_cache[url] = new_etag
+                    body = resp.read()
+                    if resp_headers.get("Content-Encoding", "").lower() == "gzip":
+                        body = gzip.decompress(body)
+                    return HttpResponse(
+                        status=getattr(resp, "status", 200),
+                        url=resp.geturl(),
+                        headers=resp_headers,
+                        body=body,
+                    )
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    return HttpResponse(
+                        status=304,
+                        url=url,
+                        headers={k: v for k, v in (e.headers or {}).items()},
+                        body=b"",
+                    )
+                last_error = e
+                retry = e.code in (429, 500, 502, 503, 504)
+                if (not retry) or attempt >= self._max_retries:
+                    raise
+            except (urllib.error.URLError, TimeoutError) as e:
+                last_error = e
+                if attempt >= self._max_retries:
+                    raise
+
+            backoff = self._base_backoff_seconds * (2**attempt)
+            jitter = random.random() * 0.25 * backoff
+            time.sleep(backoff + jitter)
+
+        assert last_error is not None
+        raise last_error
+
+    def post(self, url: str, *, body: bytes, headers: Mapping[str, str] | None = None) -> HttpResponse:
+        """
+        发送 POST（notifier 的 webhook 回调走这里）。
+
+        与 get 相同：优先复用 Session 连接池（同一 webhook 反复投递时省去
+        每条消息一次 TCP+TLS 握手），对 429/5xx 做有限次退避重试；
+        不参与 ETag 缓存（POST 无条件请求语义）。
+        """
+        request_headers = {"User-Agent": self._user_agent}
+        if headers:
+            request_headers.update(dict(headers))
+
+        last_error: Exception | None = None
+        for attempt in range(self._max_retries + 1):
+            if self._session is not None:
+                try:
+                    r = self._session.post(
+                        url,
+                        data=body,
+                        headers=request_headers,
+                        timeout=self._timeout_seconds,
+                        verify=self._verify_ssl,
+                    )
+                except requests.RequestException as e:
+                    last_error = e
+                    if attempt >= self._max_retries:
+                        raise
+                else:
+                    if r.status_code in (429, 500, 502, 503, 504) and attempt < self._max_retries:
+                        last_error = RuntimeError(f"HTTP {r.status_code}: {url}")
+                    else:
+                        r.raise_for_status()
+                        return HttpResponse(
+                            status=r.status_code,
+                            url=str(r.url),
+                            headers=dict(r.headers),
+                            body=r.content,
+                        )
+                backoff = self._base_backoff_seconds * (2**attempt)
+                jitter = random.random() * 0.25 * backoff
+                time.sleep(backoff + jitter)
+                continue
+
+            try:
+                req = urllib.request.Request(url=url, data=body, headers=request_headers, method="POST")
+                with urllib.request.urlopen(req, timeout=self._timeout_seconds, context=self._ssl_context) as resp:
+                    resp_headers = {k: v for k, v in resp.headers.items()}
+                    resp_body = resp.read()
+                    if resp_headers.get("Content-Encoding", "").lower() == "gzip":
+                        resp_body = gzip.decompress(resp_body)
                     return HttpResponse(
                         status=getattr(resp, "status", 200),
                         url=resp.geturl(),
                         headers=resp_headers,
-                        body=resp.read(),
+                        body=resp_body,
                     )
             except urllib.error.HTTPError as e:
                 last_error = e
@@ -88,14 +260,28 @@ class HttpClient:
         raise last_error
 
 
-def parse_link_header(link_value: str) -> dict[str, str]:
+# 常见形态（GitHub 等）一条正则整头扫完；参数顺序异常的罕见格式走下面的慢路径。
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="?([^",]+)"?')
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_link_header(link_value: str) -> Mapping[str, str]:
     """
-    解析 RFC5988 Link 头，返回 rel -> url 映射。
+    解析 RFC5988 Link 头，返回 rel -> url 映射（只读视图）。
 
     示例：
     <https://...>; rel="next", <https://...>; rel="last"
+
+    rel="next"/"last" 在条目数未跨页时逐轮询保持不变，按原始头字符串做
+    LRU 缓存可跳过重复解析；返回 MappingProxyType 防止缓存值被调用方改写。
     """
-    result: dict[str, str] = {}
+    matches = _LINK_RE.findall(link_value)
+    result = {rel: url for url, rel in matches}
+    # 正则只识别 rel 紧跟 URL 的常见形态；命中数少于 <...> 条目数说明有
+    # 条目带了其他前置参数（如 anchor），必须走逐条扫描补齐，否则会静默
+    # 丢 rel="next" 导致翻页中途截断。
+    if len(matches) >= link_value.count("<"):
+        return MappingProxyType(result)
     for part in link_value.split(","):
         part = part.strip()
         if not part.startswith("<") or ">;" not in part:
@@ -108,11 +294,19 @@ def parse_link_header(link_value: str) -> dict[str, str]:
             if p.startswith("rel="):
                 rel = p.split("=", 1)[1].strip().strip('"')
         if rel:
-            result[rel] = url
-    return result
+            result.setdefault(rel, url)
+    return MappingProxyType(result)
 
 
 def with_query_params(url: str, params: Mapping[str, str]) -> str:
+    # 快路径：URL 本身不带 query（sources 构造的 base URL 都是如此）时，
+    # 直接拼接即可，省掉 parse/qsl/unparse 的往返。
+    if "?" not in url:
+        filtered = [(k, v) for k, v in params.items() if v is not None]
+        if not filtered:
+            return url
+        return url + "?" + urllib.parse.urlencode(filtered)
+
     parsed = urllib.parse.urlparse(url)
     q = dict(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True))
     q.update({k: v for k, v in params.items() if v is not None})
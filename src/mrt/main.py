@@ -30,11 +30,15 @@ def build_arg_parser() -> argparse.ArgumentParser:
     return p
 
 
+# 级别名映射只算一次：getLevelNamesMapping 每次调用都会新建 dict。
+_LEVELS = logging.getLevelNamesMapping()
+
+
 def _resolve_log_level(value: str | None) -> int:
     v = (value or "").strip().upper()
     if not v:
         return logging.INFO
-    level = logging.getLevelNamesMapping().get(v)
+    level = _LEVELS.get(v)
     if isinstance(level, int):
         return level
     return logging.INFO
@@ -100,8 +104,10 @@ def main(argv: list[str] | None = None) -> int:
         config.sqlite_path,
         ",".join(config.watch_keywords) if config.watch_keywords else "<none>",
     )
-    logger.info("sources: %s", _sources_summary(runner))
-    logger.info("notifiers: %s", _notifiers_summary(runner))
+    if logger.isEnabledFor(logging.INFO):
+        # 两个 summary 的字符串拼装不便宜，级别不够时直接跳过。
+        logger.info("sources: %s", _sources_summary(runner))
+        logger.info("notifiers: %s", _notifiers_summary(runner))
     if not getattr(runner, "sources", ()):
         logger.warning("no sources configured; nothing will be polled")
     if not getattr(runner, "notifiers", ()):
@@ -114,7 +120,10 @@ def main(argv: list[str] | None = None) -> int:
         )
 
     if args.once or not args.daemon:
-        report = runner.run_once()
+        try:
+            report = runner.run_once()
+        finally:
+            runner.close()
         logger.info(
             "once done: duration_ms=%d sources=%d events_fetched=%d events_processed=%d matched=%d alerts=%d notify_failures=%d source_errors=%d",
             report.duration_ms,
@@ -140,71 +149,76 @@ def main(argv: list[str] | None = None) -> int:
         "source_errors": 0,
     }
 
-    while True:
-        cycle_id += 1
-        try:
-            report = runner.run_once()
-        except Exception:  # noqa: BLE001
-            logger.exception("cycle crashed: id=%d", cycle_id)
-            time.sleep(5)
-            continue
-
-        now = time.monotonic()
-        acc["events_fetched"] += report.events_fetched
-        acc["events_processed"] += report.events_processed
-        acc["events_matched"] += report.events_matched
-        acc["alerts_created"] += report.alerts_created
-        acc["notify_failures"] += report.notify_failures
-        acc["source_errors"] += report.source_errors
-
-        should_log_cycle = (
-            status_interval <= 0
-            or report.alerts_created > 0
-            or report.notify_failures > 0
-            or report.source_errors > 0
-            or (now - last_summary_logged_at) >= max(1, status_interval)
-        )
-        if should_log_cycle:
-            logger.info(
-                "cycle summary: id=%d duration_ms=%d events_fetched=%d events_processed=%d matched=%d alerts=%d notify_failures=%d source_errors=%d",
-                cycle_id,
-                report.duration_ms,
-                acc["events_fetched"],
-                acc["events_processed"],
-                acc["events_matched"],
-                acc["alerts_created"],
-                acc["notify_failures"],
-                acc["source_errors"],
-            )
-            acc = {k: 0 for k in acc}
-            last_summary_logged_at = now
-
-        sleep_seconds = max(1, config.poll_interval_seconds)
-        sleep_end = time.monotonic() + sleep_seconds
+    try:
         while True:
-            now = time.monotonic()
-            if now >= sleep_end:
-                break
+            cycle_id += 1
+            try:
+                report = runner.run_once()
+            except Exception:  # noqa: BLE001
+                logger.exception("cycle crashed: id=%d", cycle_id)
+                time.sleep(5)
+                continue
 
-            if status_interval > 0 and now >= next_heartbeat_at:
-                remaining = max(0, int(sleep_end - now))
+            now = time.monotonic()
+            acc["events_fetched"] += report.events_fetched
+            acc["events_processed"] += report.events_processed
+            acc["events_matched"] += report.events_matched
+            acc["alerts_created"] += report.alerts_created
+            acc["notify_failures"] += report.notify_failures
+            acc["source_errors"] += report.source_errors
+
+            should_log_cycle = (
+                status_interval <= 0
+                or report.alerts_created > 0
+                or report.notify_failures > 0
+                or report.source_errors > 0
+                or (now - last_summary_logged_at) >= max(1, status_interval)
+            )
+            if should_log_cycle:
                 logger.info(
-                    "daemon alive: cycles=%d next_poll_in=%ds last_duration_ms=%d last_alerts=%d last_notify_failures=%d last_source_errors=%d",
+                    "cycle summary: id=%d duration_ms=%d events_fetched=%d events_processed=%d matched=%d alerts=%d notify_failures=%d source_errors=%d",
                     cycle_id,
-                    remaining,
                     report.duration_ms,
-                    report.alerts_created,
-                    report.notify_failures,
-                    report.source_errors,
+                    acc["events_fetched"],
+                    acc["events_processed"],
+                    acc["events_matched"],
+                    acc["alerts_created"],
+                    acc["notify_failures"],
+                    acc["source_errors"],
                 )
-                next_heartbeat_at = now + status_interval
-
-            remaining_s = sleep_end - now
-            if status_interval > 0:
-                next_tick = max(0.2, next_heartbeat_at - now)
-                time.sleep(min(remaining_s, next_tick))
-            else:
-                time.sleep(min(remaining_s, 1.0))
+                acc = {k: 0 for k in acc}
+                last_summary_logged_at = now
+
+            # 睡到下一个事件（心跳或下次轮询）的绝对时刻，而不是每 ≤1s 醒来检查：
+            # 长间隔下减少无意义的 syscall 与调度唤醒。
+            sleep_seconds = max(1, config.poll_interval_seconds)
+            sleep_end = time.monotonic() + sleep_seconds
+            while True:
+                now = time.monotonic()
+                if now >= sleep_end:
+                    break
+
+                wake_at = min(sleep_end, next_heartbeat_at)
+                if wake_at > now:
+                    time.sleep(wake_at - now)
+
+                now = time.monotonic()
+                if status_interval > 0 and now >= next_heartbeat_at:
+                    remaining = max(0, int(sleep_end - now))
+                    logger.info(
+                        "daemon alive: cycles=%d next_poll_in=%ds last_duration_ms=%d last_alerts=%d last_notify_failures=%d last_source_errors=%d",
+                        cycle_id,
+                        remaining,
+                        report.duration_ms,
+                        report.alerts_created,
+                        report.notify_failures,
+                        report.source_errors,
+                    )
+                    next_heartbeat_at = now + status_interval
+
+    finally:
+        # Ctrl-C/异常退出时也释放通知器连接、线程池并落盘 cursor。
+        runner.close()
 
 
 if __name__ == "__main__":
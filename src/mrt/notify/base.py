@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from ..models import Alert
 
@@ -11,6 +11,9 @@ class Notifier(Protocol):
 
     v0 约定：
     - send 失败抛异常，由 runner 统一捕获并记录 failure
+    - send_many 批量发送一组告警，返回与入参对齐的逐条结果
+      （None 表示成功）；渠道可借此复用连接（如单个 SMTP 会话）。
+      Runner 对未实现 send_many 的通知器回退为逐条 send。
     - channel() 用于配置选择与故障记录
     """
 
@@ -18,3 +21,5 @@ class Notifier(Protocol):
 
     def send(self, alert: Alert) -> None: ...
 
+    def send_many(self, alerts: Sequence[Alert]) -> tuple[Exception | None, ...]: ...
+
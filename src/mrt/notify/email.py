@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import smtplib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from email.message import EmailMessage
+from typing import Sequence
 
 from ..models import Alert
 from .base import Notifier
 
 
+class _ConnectError(Exception):
+    """内部标记：连接/登录阶段的失败（原始异常挂在 __cause__）。
+
+    send_many 据此把错误一次性记给批次里剩余的全部告警，而不是逐封
+    重新对不可达的服务端付一轮（可能 20s 超时的）握手。
+    """
+
+
 @dataclass(slots=True)
 class EmailNotifier(Notifier):
     smtp_host: str
@@ -16,24 +25,92 @@ class EmailNotifier(Notifier):
     password: str
     to_list: tuple[str, ...]
     use_tls: bool = True
+    # 跨批次复用的 SMTP 会话：connect/starttls/login 握手只做一次，
+    # 之后每封邮件只剩 DATA 的往返。断线时惰性重建。
+    _conn: smtplib.SMTP | None = field(init=False, default=None, repr=False)
 
     def channel(self) -> str:
         return "email"
 
-    def send(self, alert: Alert) -> None:
-        if not self.to_list:
-            raise ValueError("EmailNotifier.to_list is empty")
-
+    def _build_message(self, alert: Alert) -> EmailMessage:
         msg = EmailMessage()
         msg["Subject"] = f"[MRT] {alert.event.title}"
         msg["From"] = self.username
         msg["To"] = ", ".join(self.to_list)
         msg.set_content(alert.content)
+        return msg
+
+    def _get_conn(self) -> smtplib.SMTP:
+        if self._conn is None:
+            try:
+                # 不可达/拒连的服务端在这里抛的是裸 OSError
+                # （ConnectionRefusedError/TimeoutError），同样属于连接阶段。
+                client = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=20)
+            except OSError as e:
+                raise _ConnectError() from e
+            try:
+                if self.use_tls:
+                    client.starttls()
+                if self.username:
+                    client.login(self.username, self.password)
+            except Exception as e:
+                try:
+                    client.close()
+                except Exception:  # noqa: BLE001
+                    pass
+                raise _ConnectError() from e
+            self._conn = client
+        return self._conn
+
+    def _drop_conn(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def _send_one(self, msg: EmailMessage) -> None:
+        try:
+            self._get_conn().send_message(msg)
+        except (smtplib.SMTPException, OSError):
+            # 连接可能被服务端闲置回收：重连一次再试，仍失败则上抛。
+            self._drop_conn()
+            self._get_conn().send_message(msg)
+
+    def send(self, alert: Alert) -> None:
+        (err,) = self.send_many((alert,))
+        if err is not None:
+            raise err
+
+    def send_many(self, alerts: Sequence[Alert]) -> tuple[Exception | None, ...]:
+        """
+        批量发送：复用长连接，逐封 DATA。
+
+        连接/登录阶段失败时，直接把该错误记给批次里剩余的所有告警，
+        不再逐封重试握手。
+        """
+        if not alerts:
+            return ()
+        if not self.to_list:
+            raise ValueError("EmailNotifier.to_list is empty")
 
-        with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=20) as client:
-            if self.use_tls:
-                client.starttls()
-            if self.username:
-                client.login(self.username, self.password)
-            client.send_message(msg)
+        results: list[Exception | None] = []
+        for alert in alerts:
+            try:
+                self._send_one(self._build_message(alert))
+                results.append(None)
+            except _ConnectError as e:
+                cause = e.__cause__ if isinstance(e.__cause__, Exception) else e
+                results.extend([cause] * (len(alerts) - len(results)))
+                break
+            except (smtplib.SMTPConnectError, smtplib.SMTPAuthenticationError) as e:
+                results.extend([e] * (len(alerts) - len(results)))
+                break
+            except Exception as e:  # noqa: BLE001
+                results.append(e)
+        return tuple(results)
 
+    def close(self) -> None:
+        """关闭长连接；下次发送会自动重建。"""
+        self._drop_conn()
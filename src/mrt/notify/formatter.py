@@ -3,28 +3,37 @@ from __future__ import annotations
 from ..models import Alert
 
 
+# 单模板一次 format：避免每条告警拼 9 个 f-string 再 join 的多次小分配。
+_TEMPLATE = (
+    "Model Release Tracker Alert\n"
+    "source: {source}\n"
+    "resource: {resource_type} {resource_id}\n"
+    "type: {event_type}\n"
+    "title: {title}\n"
+    "url: {url}\n"
+    "occurred_at: {occurred}\n"
+    "observed_at: {observed}\n"
+    "matched_rules: {rules}"
+)
+
+
 def format_alert_text(alert: Alert) -> str:
     """
     v0：统一的文本消息格式，尽量兼容 IM webhook 与邮件正文。
     """
     event = alert.event
-    rules = ", ".join(m.rule_id for m in alert.matched_rules) or "-"
-    occurred = event.occurred_at.isoformat() if event.occurred_at else "-"
-    observed = event.observed_at.isoformat()
-
-    lines = [
-        "Model Release Tracker Alert",
-        f"source: {event.source}",
-        f"resource: {event.resource_type} {event.resource_id}",
-        f"type: {event.event_type}",
-        f"title: {event.title}",
-        f"url: {event.url}",
-        f"occurred_at: {occurred}",
-        f"observed_at: {observed}",
-        f"matched_rules: {rules}",
-    ]
+    text = _TEMPLATE.format(
+        source=event.source,
+        resource_type=event.resource_type,
+        resource_id=event.resource_id,
+        event_type=event.event_type,
+        title=event.title,
+        url=event.url,
+        occurred=event.occurred_at.isoformat() if event.occurred_at else "-",
+        observed=event.observed_at.isoformat(),
+        rules=", ".join(m.rule_id for m in alert.matched_rules) or "-",
+    )
     if event.summary:
-        lines.append("")
-        lines.append(event.summary)
-    return "\n".join(lines)
+        return f"{text}\n\n{event.summary}"
+    return text
 
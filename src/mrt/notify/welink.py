@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import json
-import ssl
+import secrets
 import time
-import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Sequence
+
+try:  # 可选加速依赖：orjson（缺失时自动回退 stdlib json）
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from ..http_utils import HttpClient
 from ..models import Alert
@@ -28,41 +33,61 @@ class WeLinkNotifier(Notifier):
     is_at: bool = False
     is_at_all: bool = False
     at_accounts: tuple[str, ...] = ()
+    _base_headers: dict[str, str] = field(init=False, repr=False)
+    _base_payload: dict[str, object] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # 每条告警的请求头与 @ 配置都是静态的，构造时算好模板，send 只做浅拷贝。
+        self._base_headers = {
+            "Accept-Charset": "UTF-8",
+            "Content-Type": "application/json; charset=utf-8",
+            "Accept": "application/json",
+        }
+        base: dict[str, object] = {"messageType": "text"}
+        at_accounts = tuple(a for a in self.at_accounts if a)[:10]
+        if self.is_at_all:
+            base["isAtAll"] = True
+            base["isAt"] = False
+        elif self.is_at and at_accounts:
+            base["isAt"] = True
+            base["isAtAll"] = False
+            base["atAccounts"] = list(at_accounts)
+        else:
+            base["isAt"] = False
+            base["isAtAll"] = False
+        self._base_payload = base
 
     def channel(self) -> str:
         return "welink"
 
+    def send_many(self, alerts: Sequence[Alert]) -> tuple[Exception | None, ...]:
+        """批量发送：webhook 无会话概念，逐条发送并收集逐条结果。"""
+        results: list[Exception | None] = []
+        for alert in alerts:
+            try:
+                self.send(alert)
+                results.append(None)
+            except Exception as e:  # noqa: BLE001
+                results.append(e)
+        return tuple(results)
+
     def send(self, alert: Alert) -> None:
         payload = self._build_payload(alert.content)
-        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-
-        # 使用 GET-only 的 HttpClient 不适合发 POST，这里用标准库直接发起。
-        import urllib.request
-
-        ssl_context = getattr(self.http, "ssl_context", None)
-        if not isinstance(ssl_context, ssl.SSLContext):
-            ssl_context = ssl._create_unverified_context()
-
-        req = urllib.request.Request(
-            url=self.webhook_url,
-            data=data,
-            headers={
-                "Accept-Charset": "UTF-8",
-                "Content-Type": "application/json; charset=utf-8",
-                "Accept": "application/json",
-            },
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=20, context=ssl_context) as resp:  # noqa: S310
-            status = getattr(resp, "status", 200)
-            body = resp.read()
-            if status >= 400:
-                raise RuntimeError(f"WeLink webhook failed: status={status}, body={body[:200]!r}")
+        if orjson is not None:
+            data = orjson.dumps(payload)
+        else:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+        # 复用共享 HttpClient 的连接池：同一 webhook 连发多条时，
+        # keep-alive 免去每条消息一次 TCP+TLS 握手。
+        resp = self.http.post(self.webhook_url, body=data, headers=self._base_headers)
+        if resp.status >= 400:
+            raise RuntimeError(f"WeLink webhook failed: status={resp.status}, body={resp.body[:200]!r}")
 
         try:
-            data = json.loads(body.decode("utf-8"))
+            data = resp.json()
         except Exception as e:  # noqa: BLE001
-            raise RuntimeError(f"WeLink webhook invalid JSON response: {body[:200]!r}") from e
+            raise RuntimeError(f"WeLink webhook invalid JSON response: {resp.body[:200]!r}") from e
 
         code = data.get("code") if isinstance(data, dict) else None
         if str(code) != "0":
@@ -81,28 +106,17 @@ class WeLinkNotifier(Notifier):
             message_text = "-"
         if len(message_text) > 500:
             message_text = message_text[:499] + "…"
-
-        payload: dict[str, object] = {
-            "messageType": "text",
-            "content": {"text": message_text},
-            "timeStamp": int(time.time() * 1000),
-            "uuid": uuid.uuid4().hex,
-        }
-
-        if self.is_at_all:
-            payload["isAtAll"] = True
-            payload["isAt"] = False
-            return payload
-
-        at_accounts = tuple(a for a in self.at_accounts if a)[:10]
-        if self.is_at and at_accounts:
-            payload["isAt"] = True
-            payload["isAtAll"] = False
-            payload["atAccounts"] = list(at_accounts)
-            return payload
-
-        payload["isAt"] = False
-        payload["isAtAll"] = False
+        # 500 码点的中文/emoji 文本 UTF-8 可达 2000 字节，超出服务端字节
+        # 预算会换来 400 + notify_failure 落库再重试；按字节兜底截断，
+        # errors="ignore" 丢弃尾部被切开的不完整序列。
+        encoded = message_text.encode("utf-8")
+        if len(encoded) > 1500:
+            message_text = encoded[:1500].decode("utf-8", errors="ignore")
+
+        payload = dict(self._base_payload)
+        payload["content"] = {"text": message_text}
+        payload["timeStamp"] = time.time_ns() // 1_000_000
+        payload["uuid"] = secrets.token_hex(16)
         return payload
 
     def _decorate_text(self, text: str) -> str:
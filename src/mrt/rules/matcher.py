@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from typing import Any, Sequence
 
 from ..models import RuleMatch, TrackerEvent
 
+try:  # 可选加速依赖：pyahocorasick（C 实现多模式匹配，缺失时回退逐词扫描）
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore[assignment]
+
+
+# ASCII 大小写折叠表：监控关键词（模型名）均为 ASCII，bytes.translate + bytes in
+# 走的是 C 级 memmem，比逐事件 str.lower() + str 查找开销更低。
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
 
 @dataclass(frozen=True, slots=True)
 class RuleMatcher:
@@ -11,22 +23,94 @@ class RuleMatcher:
     v0 规则最小集：关键词匹配（大小写不敏感）。
 
     命中规则输出为多条 RuleMatch，便于通知时给出“命中原因”。
+
+    性能：关键词在构造时归一化一次；若安装了 pyahocorasick，
+    则预编译 Aho-Corasick 自动机，单次扫描即可得到全部命中，
+    避免每个事件做 K 次 Python 级子串查找。
     """
 
     keywords: tuple[str, ...]
     source_allowlist: tuple[str, ...] | None = None
+    _norm_keywords: tuple[str, ...] = field(init=False, repr=False)
+    _norm_keyword_bytes: tuple[bytes, ...] = field(init=False, repr=False)
+    _automaton: Any = field(init=False, repr=False)
+    _any_keyword_re: re.Pattern[bytes] | None = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        norm = tuple(dict.fromkeys(k.strip().lower() for k in self.keywords if (k or "").strip()))
+        object.__setattr__(self, "_norm_keywords", norm)
+        object.__setattr__(self, "_norm_keyword_bytes", tuple(k.encode("utf-8") for k in norm))
+
+        automaton = None
+        if ahocorasick is not None and norm:
+            automaton = ahocorasick.Automaton()
+            for kw in norm:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+        object.__setattr__(self, "_automaton", automaton)
+
+        # 回退路径的单趟预筛：把全部关键词编译成一条 alternation 正则，
+        # 绝大多数事件（无任何命中）只需一次 C 级扫描即可排除。
+        any_re = re.compile(b"|".join(re.escape(k.encode("utf-8")) for k in norm)) if norm else None
+        object.__setattr__(self, "_any_keyword_re", any_re)
+
+    def match_many(self, events: Sequence[TrackerEvent]) -> list[tuple[RuleMatch, ...]]:
+        """
+        批量匹配：把一批事件的文本拼成单个 haystack，一次自动机扫描得到
+        全部命中，再按偏移映射回各事件（列式/SoA 思路：避免逐事件进入
+        Python 层扫描循环）。无自动机时退化为逐事件 match。
+        """
+        if self._automaton is None or not self._norm_keywords or len(events) < 2:
+            return [self.match(e) for e in events]
+
+        # \x00 作为事件间分隔符：不会出现在关键词中，命中不可能跨事件。
+        texts: list[str] = []
+        ends: list[int] = []
+        pos = 0
+        for e in events:
+            t = f"{e.title}\n{e.summary}".lower()
+            texts.append(t)
+            pos += len(t) + 1
+            ends.append(pos)
+        haystack = "\x00".join(texts)
+
+        hits: list[dict[str, None]] = [{} for _ in events]
+        idx = 0
+        for end_pos, kw in self._automaton.iter(haystack):
+            while end_pos >= ends[idx]:
+                idx += 1
+            hits[idx].setdefault(kw)
+
+        allow = self.source_allowlist
+        results: list[tuple[RuleMatch, ...]] = []
+        for e, hit in zip(events, hits):
+            if allow and e.source not in allow:
+                results.append(())
+                continue
+            results.append(
+                tuple(RuleMatch(rule_id=f"keyword:{kw}", reason=f"matched keyword '{kw}'") for kw in hit)
+            )
+        return results
 
     def match(self, event: TrackerEvent) -> tuple[RuleMatch, ...]:
         if self.source_allowlist and event.source not in self.source_allowlist:
             return ()
+        if not self._norm_keywords:
+            return ()
 
-        haystack = f"{event.title}\n{event.summary}".lower()
         matches: list[RuleMatch] = []
-        for kw in self.keywords:
-            k = (kw or "").strip().lower()
-            if not k:
-                continue
-            if k in haystack:
-                matches.append(RuleMatch(rule_id=f"keyword:{k}", reason=f"matched keyword '{k}'"))
+        if self._automaton is not None:
+            haystack = f"{event.title}\n{event.summary}".lower()
+            hit: set[str] = set()
+            for _, kw in self._automaton.iter(haystack):
+                if kw not in hit:
+                    hit.add(kw)
+                    matches.append(RuleMatch(rule_id=f"keyword:{kw}", reason=f"matched keyword '{kw}'"))
+        else:
+            bhay = (event.title + "\n" + event.summary).encode("utf-8").translate(_ASCII_LOWER)
+            if self._any_keyword_re is not None and self._any_keyword_re.search(bhay) is None:
+                return ()
+            for kw, bkw in zip(self._norm_keywords, self._norm_keyword_bytes):
+                if bkw in bhay:
+                    matches.append(RuleMatch(rule_id=f"keyword:{kw}", reason=f"matched keyword '{kw}'"))
         return tuple(matches)
-
@@ -3,12 +3,13 @@ from __future__ import annotations
 import logging
 import os
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 from .config import AppConfig
 from .http_utils import HttpClient
-from .models import Alert, TrackerEvent
+from .models import Alert, RuleMatch, TrackerEvent
 from .notify.email import EmailNotifier
 from .notify.formatter import format_alert_text
 from .notify.welink import WeLinkNotifier
@@ -62,14 +63,14 @@ class RunOnceReport:
 
 
 @dataclass(slots=True)
-class _ProcessEventReport:
-    processed: bool
-    skipped_seen: bool
-    matched: bool
-    alert_created: bool
-    notify_attempts: int
-    notify_successes: int
-    notify_failures: int
+class _SourceFetch:
+    """单个 source 的拉取结果（并发拉取阶段的中间产物）。"""
+
+    source_key: str
+    cursor: str | None
+    result: object | None
+    error: str | None
+    fetch_ms: int
 
 
 @dataclass(slots=True)
@@ -85,6 +86,19 @@ class Runner:
     notifiers: tuple[object, ...]
     record_unmatched_as_seen: bool = True
     bootstrap_on_start: bool = True
+    max_poll_workers: int = 8
+    # sources/notifiers 共享的 HTTP 客户端；仅用于 close 时释放连接池。
+    http: HttpClient | None = None
+    # 跨 run_once 复用的拉取线程池（daemon 模式下避免每周期重建线程）。
+    _poll_pool: ThreadPoolExecutor | None = field(init=False, default=None, repr=False)
+    # 周期内累积的 cursor 更新，run_once 结束时批量落库（M 次 fsync 降为 1 次）。
+    _pending_cursors: dict[str, str | None] = field(init=False, default_factory=dict, repr=False)
+    # 渠道列表在 Runner 生命周期内不变，构造时算一次，省掉每条告警的
+    # K 次方法调用 + tuple 分配。
+    _notifier_channels: tuple[str, ...] = field(init=False, default=(), repr=False)
+
+    def __post_init__(self) -> None:
+        self._notifier_channels = tuple(n.channel() for n in self.notifiers)
 
     def run_once(self) -> RunOnceReport:
         """
@@ -114,59 +128,156 @@ class Runner:
             "source_errors": 0,
         }
 
-        for source in self.sources:
+        # 拉取阶段并发执行：各 source 的网络延迟相互独立，
+        # 周期耗时从“各延迟之和”降为“最大延迟”。
+        # 事件处理与状态写入仍在主线程串行，保证告警顺序与 SQLite 写入简单可控。
+        def _fetch(source) -> _SourceFetch:  # noqa: ANN001
             source_key = source.key()
             cursor = self.state.get_cursor(source_key)
-
-            source_start_t = time.monotonic()
-            error: str | None = None
-            cursor_after: str | None = cursor
-            events_fetched = 0
-            events_processed = 0
-            events_skipped_seen = 0
-            events_matched = 0
-            alerts_created = 0
-            notify_attempts = 0
-            notify_successes = 0
-            notify_failures = 0
-
+            t0 = time.monotonic()
             try:
                 result = source.poll(cursor)
-                events = list(result.events)
-                events_fetched = len(events)
-                cursor_after = result.new_cursor if result.new_cursor is not None else cursor
             except Exception as e:  # noqa: BLE001
-                error = f"{type(e).__name__}: {e}"
-                totals["source_errors"] += 1
                 logger.exception(
                     "source poll failed: source_key=%s source_type=%s cursor=%r",
                     source_key,
                     type(source).__name__,
                     cursor,
                 )
-                source_reports.append(
-                    SourceRunReport(
-                        source_key=source_key,
-                        source_type=type(source).__name__,
-                        cursor_before=cursor,
-                        cursor_after=cursor_after,
-                        events_fetched=0,
-                        events_processed=0,
-                        events_skipped_seen=0,
-                        events_matched=0,
-                        alerts_created=0,
-                        notify_attempts=0,
-                        notify_successes=0,
-                        notify_failures=0,
-                        error=error,
-                        duration_ms=int((time.monotonic() - source_start_t) * 1000),
-                    )
+                return _SourceFetch(
+                    source_key=source_key,
+                    cursor=cursor,
+                    result=None,
+                    error=f"{type(e).__name__}: {e}",
+                    fetch_ms=int((time.monotonic() - t0) * 1000),
+                )
+            return _SourceFetch(
+                source_key=source_key,
+                cursor=cursor,
+                result=result,
+                error=None,
+                fetch_ms=int((time.monotonic() - t0) * 1000),
+            )
+
+        if len(self.sources) > 1:
+            if self._poll_pool is None:
+                self._poll_pool = ThreadPoolExecutor(
+                    max_workers=min(self.max_poll_workers, len(self.sources)),
+                    thread_name_prefix="mrt-poll",
                 )
-                continue
+            fetches = list(self._poll_pool.map(_fetch, self.sources))
+        else:
+            fetches = [_fetch(s) for s in self.sources]
+
+        try:
+            for source, fetch in zip(self.sources, fetches):
+                source_key = fetch.source_key
+                cursor = fetch.cursor
+
+                process_start_t = time.monotonic()
+                cursor_after: str | None = cursor
+                events_processed = 0
+                events_skipped_seen = 0
+                events_matched = 0
+                alerts_created = 0
+                notify_attempts = 0
+                notify_successes = 0
+                notify_failures = 0
+
+                if fetch.error is not None:
+                    totals["source_errors"] += 1
+                    source_reports.append(
+                        SourceRunReport(
+                            source_key=source_key,
+                            source_type=type(source).__name__,
+                            cursor_before=cursor,
+                            cursor_after=cursor_after,
+                            events_fetched=0,
+                            events_processed=0,
+                            events_skipped_seen=0,
+                            events_matched=0,
+                            alerts_created=0,
+                            notify_attempts=0,
+                            notify_successes=0,
+                            notify_failures=0,
+                            error=fetch.error,
+                            duration_ms=fetch.fetch_ms,
+                        )
+                    )
+                    continue
+
+                result = fetch.result
+                events = list(result.events)
+                events_fetched = len(events)
+                cursor_after = result.new_cursor if result.new_cursor is not None else cursor
+
+                if cursor is None and self.bootstrap_on_start:
+                    if result.new_cursor is not None:
+                        self._pending_cursors[source_key] = result.new_cursor
+                    source_reports.append(
+                        SourceRunReport(
+                            source_key=source_key,
+                            source_type=type(source).__name__,
+                            cursor_before=cursor,
+                            cursor_after=cursor_after,
+                            events_fetched=events_fetched,
+                            events_processed=0,
+                            events_skipped_seen=0,
+                            events_matched=0,
+                            alerts_created=0,
+                            notify_attempts=0,
+                            notify_successes=0,
+                            notify_failures=0,
+                            error=None,
+                            duration_ms=fetch.fetch_ms + int((time.monotonic() - process_start_t) * 1000),
+                        )
+                    )
+                    totals["events_fetched"] += events_fetched
+                    continue
+
+                # 排序保证通知顺序稳定（避免同一批事件在不同运行中顺序抖动）。
+                # GitHub 等源按 updated desc 返回，Timsort 对单调输入是 O(N)
+                # （识别降序 run 后一次翻转）；指纹键有实例级缓存，不会重复哈希。
+                # 这里刻意保留物化 list：后面的 filter_unseen/match_many 都按批处理。
+                events.sort(key=lambda e: (e.occurred_at or e.observed_at, e.fingerprint()))
+                fps = [e.fingerprint() for e in events]
+                # 批量化状态读写：一次 SELECT IN 预载去重集合，mark_seen/save_alert
+                # 累积后单事务落库，把 N 次往返+fsync 压到常数次。
+                unseen = self.state.filter_unseen(fps)
+                all_matches = self.matcher.match_many(events)
+
+                pending: list[Alert] = []
+                to_mark_seen: list[str] = []
+                # 循环不变量提为局部名：配置位与 bound method 在 per-event
+                # 循环里不再走属性查找。
+                record_unmatched = self.record_unmatched_as_seen
+                build_alert = self._build_alert
+                discard = unseen.discard
+                mark = to_mark_seen.append
+                for event, fp, matches in zip(events, fps, all_matches):
+                    events_processed += 1
+                    if fp not in unseen:
+                        events_skipped_seen += 1
+                        continue
+                    # 同批次内指纹重复的事件按已见处理，保持与逐条去重一致的语义。
+                    discard(fp)
+                    if not matches:
+                        if record_unmatched:
+                            mark(fp)
+                        continue
+                    events_matched += 1
+                    alerts_created += 1
+                    pending.append(build_alert(event, fp, matches))
+
+                if pending:
+                    self.state.save_alerts_bulk(pending)
+                    notify_attempts, notify_successes, notify_failures, delivered = self._dispatch_pending(pending)
+                    to_mark_seen.extend(delivered)
+                self.state.mark_seen_bulk(to_mark_seen)
+
+                if result.new_cursor is not None and notify_failures == 0:
+                    self._pending_cursors[source_key] = result.new_cursor
 
-            if cursor is None and self.bootstrap_on_start:
-                if result.new_cursor is not None:
-                    self.state.set_cursor(source_key, result.new_cursor)
                 source_reports.append(
                     SourceRunReport(
                         source_key=source_key,
@@ -174,67 +285,30 @@ class Runner:
                         cursor_before=cursor,
                         cursor_after=cursor_after,
                         events_fetched=events_fetched,
-                        events_processed=0,
-                        events_skipped_seen=0,
-                        events_matched=0,
-                        alerts_created=0,
-                        notify_attempts=0,
-                        notify_successes=0,
-                        notify_failures=0,
+                        events_processed=events_processed,
+                        events_skipped_seen=events_skipped_seen,
+                        events_matched=events_matched,
+                        alerts_created=alerts_created,
+                        notify_attempts=notify_attempts,
+                        notify_successes=notify_successes,
+                        notify_failures=notify_failures,
                         error=None,
-                        duration_ms=int((time.monotonic() - source_start_t) * 1000),
+                        duration_ms=fetch.fetch_ms + int((time.monotonic() - process_start_t) * 1000),
                     )
                 )
-                totals["events_fetched"] += events_fetched
-                continue
-
-            # 排序保证通知顺序稳定（避免同一批事件在不同运行中顺序抖动）。
-            events.sort(key=lambda e: (e.occurred_at or e.observed_at, e.fingerprint()))
-            for event in events:
-                r = self._process_event(event)
-                if not r.processed:
-                    continue
-                events_processed += 1
-                if r.skipped_seen:
-                    events_skipped_seen += 1
-                if r.matched:
-                    events_matched += 1
-                if r.alert_created:
-                    alerts_created += 1
-                notify_attempts += r.notify_attempts
-                notify_successes += r.notify_successes
-                notify_failures += r.notify_failures
-
-            if result.new_cursor is not None and notify_failures == 0:
-                self.state.set_cursor(source_key, result.new_cursor)
-
-            source_reports.append(
-                SourceRunReport(
-                    source_key=source_key,
-                    source_type=type(source).__name__,
-                    cursor_before=cursor,
-                    cursor_after=cursor_after,
-                    events_fetched=events_fetched,
-                    events_processed=events_processed,
-                    events_skipped_seen=events_skipped_seen,
-                    events_matched=events_matched,
-                    alerts_created=alerts_created,
-                    notify_attempts=notify_attempts,
-                    notify_successes=notify_successes,
-                    notify_failures=notify_failures,
-                    error=error,
-                    duration_ms=int((time.monotonic() - source_start_t) * 1000),
-                )
-            )
 
-            totals["events_fetched"] += events_fetched
-            totals["events_processed"] += events_processed
-            totals["events_skipped_seen"] += events_skipped_seen
-            totals["events_matched"] += events_matched
-            totals["alerts_created"] += alerts_created
-            totals["notify_attempts"] += notify_attempts
-            totals["notify_successes"] += notify_successes
-            totals["notify_failures"] += notify_failures
+                totals["events_fetched"] += events_fetched
+                totals["events_processed"] += events_processed
+                totals["events_skipped_seen"] += events_skipped_seen
+                totals["events_matched"] += events_matched
+                totals["alerts_created"] += alerts_created
+                totals["notify_attempts"] += notify_attempts
+                totals["notify_successes"] += notify_successes
+                totals["notify_failures"] += notify_failures
+
+        finally:
+            # 即使处理阶段抛异常也要落盘已推进的 cursor，避免丢进度。
+            self._flush_cursors()
 
         finished_at = _utc_now()
         duration_ms = int((time.monotonic() - start_t) * 1000)
@@ -254,92 +328,109 @@ class Runner:
             source_errors=totals["source_errors"],
         )
 
-    def _process_event(self, event: TrackerEvent) -> _ProcessEventReport:
-        fp = event.fingerprint()
-        if self.state.has_seen(fp):
-            return _ProcessEventReport(
-                processed=True,
-                skipped_seen=True,
-                matched=False,
-                alert_created=False,
-                notify_attempts=0,
-                notify_successes=0,
-                notify_failures=0,
-            )
-
-        matches = self.matcher.match(event)
-        if not matches:
-            if self.record_unmatched_as_seen:
-                self.state.mark_seen(fp)
-            return _ProcessEventReport(
-                processed=True,
-                skipped_seen=False,
-                matched=False,
-                alert_created=False,
-                notify_attempts=0,
-                notify_successes=0,
-                notify_failures=0,
-            )
-
-        channels = tuple(n.channel() for n in self.notifiers)
+    def close(self) -> None:
+        """释放长生命周期资源：未落库的 cursor、通知器连接与拉取线程池。"""
+        self._flush_cursors()
+        for notifier in self.notifiers:
+            close = getattr(notifier, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:  # noqa: BLE001
+                    logger.exception("notifier close failed: %s", type(notifier).__name__)
+        if self._poll_pool is not None:
+            self._poll_pool.shutdown(wait=False, cancel_futures=True)
+            self._poll_pool = None
+        if self.http is not None:
+            self.http.close()
+        self.state.close()
+
+    def _flush_cursors(self) -> None:
+        """把周期内累积的 cursor 更新一次性落库；落库成功后清空累积。"""
+        if not self._pending_cursors:
+            return
+        self.state.set_cursors_bulk(self._pending_cursors)
+        self._pending_cursors.clear()
+
+    def _build_alert(self, event: TrackerEvent, fp: str, matches: tuple[RuleMatch, ...]) -> Alert:
+        """构建告警对象；去重与落库由 run_once 批量处理。"""
         alert = Alert(
             fingerprint=fp,
             event=event,
             matched_rules=matches,
-            channels=channels,
+            channels=self._notifier_channels,
             content="",
             created_at=_utc_now(),
         )
-        alert = Alert(
-            fingerprint=alert.fingerprint,
-            event=alert.event,
-            matched_rules=alert.matched_rules,
-            channels=alert.channels,
-            content=format_alert_text(alert),
-            created_at=alert.created_at,
-        )
+        # Alert 未声明 frozen：原地补上渲染结果，省掉第二次整字段拷贝构造。
+        alert.content = format_alert_text(alert)
+        return alert
 
-        self.state.save_alert(alert)
+    def _dispatch_pending(self, alerts: list[Alert]) -> tuple[int, int, int, list[str]]:
+        """
+        将一批告警分发到所有渠道。
 
-        notify_attempts = 0
-        notify_successes = 0
-        notify_failures = 0
-        for notifier in self.notifiers:
+        - 每个渠道一次 send_many（渠道可复用连接，如单个 SMTP 会话），渠道间并发
+        - 未实现 send_many 的通知器回退为逐条 send
+        - 返回全渠道成功的告警指纹列表，由调用方批量 mark_seen，
+          语义与逐条通知一致
+        """
+
+        def _send_all(notifier) -> tuple[str, tuple[Exception | None, ...]]:  # noqa: ANN001
             channel = notifier.channel()
-            if channel not in alert.channels:
-                continue
-            notify_attempts += 1
             try:
-                notifier.send(alert)
-                notify_successes += 1
+                send_many = getattr(notifier, "send_many", None)
+                if callable(send_many):
+                    return channel, tuple(send_many(alerts))
+                results: list[Exception | None] = []
+                for alert in alerts:
+                    try:
+                        notifier.send(alert)
+                        results.append(None)
+                    except Exception as e:  # noqa: BLE001
+                        results.append(e)
+                return channel, tuple(results)
             except Exception as e:  # noqa: BLE001
-                notify_failures += 1
-                self.state.record_notify_failure(
-                    fingerprint=fp,
-                    channel=channel,
-                    error=f"{type(e).__name__}: {e}",
-                )
-                logger.exception(
-                    "notify failed: channel=%s notifier_type=%s fingerprint=%s event_source=%s event_type=%s url=%s",
+                return channel, tuple([e] * len(alerts))
+
+        if len(self.notifiers) > 1:
+            with ThreadPoolExecutor(max_workers=len(self.notifiers)) as pool:
+                channel_results = list(pool.map(_send_all, self.notifiers))
+        else:
+            channel_results = [_send_all(n) for n in self.notifiers]
+
+        attempts = 0
+        successes = 0
+        failures = 0
+        delivered: list[str] = []
+        failure_rows: list[tuple[str, str, str]] = []
+        for i, alert in enumerate(alerts):
+            alert_failures = 0
+            # alert.channels 与 _notifier_channels 同源，无需逐条过滤渠道。
+            for channel, results in channel_results:
+                attempts += 1
+                err = results[i]
+                if err is None:
+                    successes += 1
+                    continue
+                failures += 1
+                alert_failures += 1
+                error = f"{type(err).__name__}: {err}"
+                failure_rows.append((alert.fingerprint, channel, error))
+                logger.error(
+                    "notify failed: channel=%s fingerprint=%s event_source=%s event_type=%s url=%s error=%s",
                     channel,
-                    type(notifier).__name__,
-                    fp,
-                    event.source,
-                    event.event_type,
-                    event.url,
+                    alert.fingerprint,
+                    alert.event.source,
+                    alert.event.event_type,
+                    alert.event.url,
+                    error,
+                    exc_info=err,
                 )
-
-        if notify_failures == 0:
-            self.state.mark_seen(fp)
-        return _ProcessEventReport(
-            processed=True,
-            skipped_seen=False,
-            matched=True,
-            alert_created=True,
-            notify_attempts=notify_attempts,
-            notify_successes=notify_successes,
-            notify_failures=notify_failures,
-        )
+            if alert_failures == 0:
+                delivered.append(alert.fingerprint)
+        self.state.record_notify_failures_bulk(failure_rows)
+        return attempts, successes, failures, delivered
 
 
 def build_runner(config: AppConfig) -> Runner:
@@ -349,13 +440,15 @@ def build_runner(config: AppConfig) -> Runner:
     设计取舍（v0）：
     - 统一在这里做“配置 -> 实例”的装配，Runner 内只关注流程编排
     - 对 secret/token 只通过环境变量读取，避免落盘
+    - 所有 source/notifier 共享同一个 HttpClient（keep-alive 连接池、
+      ETag 缓存都挂在它上面）；新增组件请复用传入实例，不要自建传输层
     """
     http = HttpClient(verify_ssl=False)
     state = SqliteStateStore(config.sqlite_path)
 
     sources: list[object] = []
     if config.github and config.github.repos:
-        gh_token = config.resolve_env(config.github.token_env)
+        gh_token = config.github.token
         for repo in config.github.repos:
             if config.github.monitor_issues:
                 sources.append(GitHubRepoIssuesSource(repo=repo, http=http, token=gh_token))
@@ -363,7 +456,7 @@ def build_runner(config: AppConfig) -> Runner:
                 sources.append(GitHubRepoPullsSource(repo=repo, http=http, token=gh_token))
 
     if config.huggingface and config.huggingface.orgs:
-        hf_token = config.resolve_env(config.huggingface.token_env)
+        hf_token = config.huggingface.token
         for org in config.huggingface.orgs:
             sources.append(HuggingFaceOrgModelsSource(org=org, http=http, token=hf_token))
 
@@ -375,7 +468,7 @@ def build_runner(config: AppConfig) -> Runner:
 
     notifiers: list[object] = []
     if config.welink:
-        webhook_url = config.resolve_env(config.welink.webhook_env)
+        webhook_url = config.welink.webhook_url
         if webhook_url:
             notifiers.append(
                 WeLinkNotifier(
@@ -388,8 +481,8 @@ def build_runner(config: AppConfig) -> Runner:
             )
 
     if config.email:
-        username = config.resolve_env(config.email.user_env) or ""
-        password = config.resolve_env(config.email.password_env) or ""
+        username = config.email.username
+        password = config.email.password
         if config.email.smtp_host and config.email.to_list:
             notifiers.append(
                 EmailNotifier(
@@ -407,4 +500,5 @@ def build_runner(config: AppConfig) -> Runner:
         sources=tuple(sources),
         matcher=matcher,
         notifiers=tuple(notifiers),
+        http=http,
     )
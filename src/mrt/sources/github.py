@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar, Iterator, Mapping
 
 from ..http_utils import HttpClient, parse_link_header, with_query_params
 from ..models import TrackerEvent, parse_rfc3339_datetime, utc_now
 from .base import PollResult
 
 
+# 是否在事件上保留 GitHub 原始 JSON 条目（单条常见 5~20KB）。
+# 下游匹配/通知只用 title/summary/url 等投影字段，默认不保留：
+# 事件要一路活到去重与落库，保留原始条目会把峰值内存放大一个数量级。
+_KEEP_RAW = os.environ.get("MRT_GITHUB_KEEP_RAW", "").strip().lower() in ("1", "true", "yes")
+
+
 def _truncate(text: str, limit: int = 400) -> str:
     text = (text or "").strip()
     if len(text) <= limit:
@@ -21,9 +31,24 @@ def _encode_cursor(updated_after: datetime) -> str:
     return json.dumps({"updated_after": updated_after.isoformat()}, ensure_ascii=False, separators=(",", ":"))
 
 
+def _page_number(url: str) -> int | None:
+    try:
+        q = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(url).query))
+        return int(q["page"])
+    except Exception:
+        return None
+
+
 def _decode_cursor(cursor: str | None) -> datetime | None:
     if not cursor:
         return None
+    # 快路径：cursor 由上面的 _encode_cursor 生成，形状固定为
+    # {"updated_after":"<iso8601>"}，直接切片取值即可，免去 JSON 解析。
+    if cursor.startswith('{"updated_after":"') and cursor.endswith('"}'):
+        try:
+            return parse_rfc3339_datetime(cursor[18:-2])
+        except ValueError:
+            return None
     try:
         obj = json.loads(cursor)
         if isinstance(obj, dict) and isinstance(obj.get("updated_after"), str):
@@ -33,43 +58,110 @@ def _decode_cursor(cursor: str | None) -> datetime | None:
     return None
 
 
+# issues/pulls 列表接口共用的静态查询参数。
+_LIST_PARAMS = MappingProxyType(
+    {
+        "state": "all",
+        "sort": "updated",
+        "direction": "desc",
+        "per_page": "100",
+    }
+)
+
+
 @dataclass(slots=True)
 class _GitHubBase:
     repo: str
     http: HttpClient
     token: str | None = None
+    # repo/token 构造后不变：请求头与列表 URL 在 __post_init__ 算一次，
+    # 免去每页请求重建同样的 dict/字符串。
+    _headers_cached: Mapping[str, str] = field(init=False, repr=False)
+    _list_url: str = field(init=False, repr=False)
 
-    def _headers(self) -> Mapping[str, str]:
+    _endpoint: ClassVar[str] = ""
+
+    def __post_init__(self) -> None:
         headers = {
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
-        return headers
+        self._headers_cached = MappingProxyType(headers)
+        base_url = f"https://api.github.com/repos/{self.repo}/{self._endpoint}"
+        self._list_url = with_query_params(base_url, _LIST_PARAMS)
+
+    def _headers(self) -> Mapping[str, str]:
+        return self._headers_cached
+
+    def _parse_page(self, resp) -> tuple[list[Mapping[str, Any]], Mapping[str, str]]:  # noqa: ANN001
+        data = resp.json()
+        if not isinstance(data, list):
+            raise ValueError(f"GitHub API expected list, got {type(data)}: {resp.url}")
+        items: list[Mapping[str, Any]] = [x for x in data if isinstance(x, dict)]
+        return items, resp.headers
 
     def _iter_json_pages(
-        self, url: str, *, max_pages: int | None = None
+        self, url: str, *, max_pages: int | None = None, parallel: bool = False
     ) -> Iterator[tuple[list[Mapping[str, Any]], Mapping[str, str]]]:
-        next_url: str | None = url
-        pages = 0
+        """
+        按 Link 头翻页。
+
+        parallel=True 时，若首页带有 rel="last"，则从中推导出页码区间，
+        用线程池并发拉取第 2..K 页（各页独立，总耗时从 K×RTT 降为 ~1×RTT）。
+        只应在结果已被服务端过滤（如 issues 的 since 参数）、确定每页都要用到
+        时开启；依赖按需早停的调用方保持惰性顺序翻页。
+        """
+        resp = self.http.get(url, headers=self._headers())
+        if resp.status == 304:
+            # 条件请求命中缓存：该端点自上次以来无变化，无需解析与翻页。
+            return
+        yield self._parse_page(resp)
+        if max_pages is not None and max_pages <= 1:
+            return
+
+        link = resp.headers.get("Link") or resp.headers.get("link")
+        if not link:
+            return
+        links = parse_link_header(link)
+        next_url = links.get("next")
+        if not next_url:
+            return
+
+        remaining = None if max_pages is None else max_pages - 1
+
+        if parallel:
+            last_url = links.get("last")
+            next_page = _page_number(next_url)
+            last_page = _page_number(last_url) if last_url else None
+            if next_page is not None and last_page is not None and last_page >= next_page:
+                pages = list(range(next_page, last_page + 1))
+                if remaining is not None:
+                    pages = pages[:remaining]
+                urls = [with_query_params(next_url, {"page": str(p)}) for p in pages]
+                headers = self._headers()
+                with ThreadPoolExecutor(max_workers=min(8, len(urls))) as pool:
+                    resps = list(pool.map(lambda u: self.http.get(u, headers=headers), urls))
+                for r in resps:
+                    if r.status == 304:
+                        continue
+                    yield self._parse_page(r)
+                return
+
         while next_url:
-            resp = self.http.get(next_url, headers=self._headers())
-            data = resp.json()
-            if not isinstance(data, list):
-                raise ValueError(f"GitHub API expected list, got {type(data)}: {resp.url}")
-            items: list[Mapping[str, Any]] = [x for x in data if isinstance(x, dict)]
-            yield items, resp.headers
-
-            pages += 1
-            if max_pages is not None and pages >= max_pages:
+            if remaining is not None and remaining <= 0:
                 break
-
+            resp = self.http.get(next_url, headers=self._headers())
+            if resp.status == 304:
+                return
+            yield self._parse_page(resp)
+            if remaining is not None:
+                remaining -= 1
             link = resp.headers.get("Link") or resp.headers.get("link")
             if not link:
                 break
-            links = parse_link_header(link)
-            next_url = links.get("next")
+            next_url = parse_link_header(link).get("next")
 
 
 @dataclass(slots=True)
@@ -80,27 +172,27 @@ class GitHubRepoIssuesSource(_GitHubBase):
     cursor 语义：updated_after（RFC3339）
     """
 
+    _endpoint: ClassVar[str] = "issues"
+
     def key(self) -> str:
         return f"github:{self.repo}:issues"
 
     def poll(self, cursor: str | None) -> PollResult:
         updated_after = _decode_cursor(cursor)
-        base_url = f"https://api.github.com/repos/{self.repo}/issues"
-        params = {
-            "state": "all",
-            "sort": "updated",
-            "direction": "desc",
-            "per_page": "100",
-        }
+        url = self._list_url
         if updated_after is not None:
-            params["since"] = updated_after.isoformat().replace("+00:00", "Z")
-        url = with_query_params(base_url, params)
+            # _list_url 已带固定 query，直接拼 &since= 即可；ISO8601 里只有
+            # 冒号需要转义，免去整段 parse/merge/urlencode 往返。
+            since = updated_after.isoformat().replace("+00:00", "Z")
+            url = f"{url}&since={urllib.parse.quote(since, safe='')}"
 
         newest_updated_at: datetime | None = updated_after
         events: list[TrackerEvent] = []
 
         max_pages = 1 if updated_after is None else None
-        for items, _headers in self._iter_json_pages(url, max_pages=max_pages):
+        reached_cutoff = False
+        # since 参数已让服务端只返回新条目，每一页都需要，适合并发翻页。
+        for items, _headers in self._iter_json_pages(url, max_pages=max_pages, parallel=True):
             for it in items:
                 if "pull_request" in it:
                     continue
@@ -109,15 +201,20 @@ class GitHubRepoIssuesSource(_GitHubBase):
                     continue
                 updated_at = parse_rfc3339_datetime(updated_at_s)
                 if updated_after is not None and updated_at <= updated_after:
-                    continue
+                    # 结果按 updated desc 排列：到达 cursor 水位后，后续条目都是旧的。
+                    reached_cutoff = True
+                    break
                 if newest_updated_at is None or updated_at > newest_updated_at:
                     newest_updated_at = updated_at
 
-                issue_id = str(it.get("id") or it.get("number") or it.get("url") or "")
-                title = str(it.get("title") or "")
-                body = str(it.get("body") or "")
-                html_url = str(it.get("html_url") or it.get("url") or "")
-                state = str(it.get("state") or "")
+                # 字段投影集中在此处完成；局部绑定 get 省掉重复属性查找，
+                # 投影后原始条目即可随页释放（除非显式要求保留 raw）。
+                get = it.get
+                issue_id = str(get("id") or get("number") or get("url") or "")
+                title = str(get("title") or "")
+                body = str(get("body") or "")
+                html_url = str(get("html_url") or get("url") or "")
+                state = str(get("state") or "")
                 event_type = "issue_updated" if state else "issue_event"
 
                 events.append(
@@ -132,9 +229,11 @@ class GitHubRepoIssuesSource(_GitHubBase):
                         url=html_url,
                         occurred_at=updated_at,
                         observed_at=utc_now(),
-                        raw=it,
+                        raw=it if _KEEP_RAW else None,
                     )
                 )
+            if reached_cutoff and updated_after is not None:
+                break
 
         new_cursor = _encode_cursor(newest_updated_at) if newest_updated_at is not None else cursor
         return PollResult(events=events, new_cursor=new_cursor)
@@ -148,21 +247,14 @@ class GitHubRepoPullsSource(_GitHubBase):
     cursor 语义：updated_after（RFC3339）
     """
 
+    _endpoint: ClassVar[str] = "pulls"
+
     def key(self) -> str:
         return f"github:{self.repo}:pulls"
 
     def poll(self, cursor: str | None) -> PollResult:
         updated_after = _decode_cursor(cursor)
-        base_url = f"https://api.github.com/repos/{self.repo}/pulls"
-        url = with_query_params(
-            base_url,
-            {
-                "state": "all",
-                "sort": "updated",
-                "direction": "desc",
-                "per_page": "100",
-            },
-        )
+        url = self._list_url
 
         newest_updated_at: datetime | None = updated_after
         events: list[TrackerEvent] = []
@@ -181,11 +273,12 @@ class GitHubRepoPullsSource(_GitHubBase):
                 if newest_updated_at is None or updated_at > newest_updated_at:
                     newest_updated_at = updated_at
 
-                pr_id = str(it.get("id") or it.get("number") or it.get("url") or "")
-                title = str(it.get("title") or "")
-                body = str(it.get("body") or "")
-                html_url = str(it.get("html_url") or it.get("url") or "")
-                merged_at = it.get("merged_at")
+                get = it.get
+                pr_id = str(get("id") or get("number") or get("url") or "")
+                title = str(get("title") or "")
+                body = str(get("body") or "")
+                html_url = str(get("html_url") or get("url") or "")
+                merged_at = get("merged_at")
                 if isinstance(merged_at, str) and merged_at:
                     event_type = "pr_merged"
                     occurred_at = parse_rfc3339_datetime(merged_at)
@@ -205,7 +298,7 @@ class GitHubRepoPullsSource(_GitHubBase):
                         url=html_url,
                         occurred_at=occurred_at,
                         observed_at=utc_now(),
-                        raw=it,
+                        raw=it if _KEEP_RAW else None,
                     )
                 )
             if reached_cutoff and updated_after is not None:
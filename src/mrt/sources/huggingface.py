@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Mapping
 
 from ..http_utils import HttpClient, parse_link_header, with_query_params
@@ -10,6 +13,27 @@ from ..models import TrackerEvent, parse_rfc3339_datetime, utc_now
 from .base import PollResult
 
 
+# 是否在事件上保留 HF 原始记录。full=true 的记录携带 siblings/tags/cardData
+# 等大量下游用不到的字段，默认投影后即弃，与 GitHub 源的做法一致。
+_KEEP_RAW = os.environ.get("MRT_HF_KEEP_RAW", "").strip().lower() in ("1", "true", "yes")
+
+
+def _page_reaches_cutoff(data: list[Any], cutoff: datetime | None) -> bool:
+    """判断一页（lastModified desc）的末条记录是否已到达 cursor 水位。"""
+    if cutoff is None:
+        return False
+    for it in reversed(data):
+        if not isinstance(it, dict):
+            continue
+        last_modified_s = it.get("lastModified") or it.get("last_modified")
+        if isinstance(last_modified_s, str):
+            try:
+                return parse_rfc3339_datetime(last_modified_s) <= cutoff
+            except ValueError:
+                return False
+    return False
+
+
 def _encode_cursor(updated_after: datetime) -> str:
     return json.dumps({"last_modified_after": updated_after.isoformat()}, ensure_ascii=False, separators=(",", ":"))
 
@@ -17,6 +41,13 @@ def _encode_cursor(updated_after: datetime) -> str:
 def _decode_cursor(cursor: str | None) -> datetime | None:
     if not cursor:
         return None
+    # 快路径：cursor 形状固定为 {"last_modified_after":"<iso8601>"}
+    # （见 _encode_cursor），直接切片取值，免去 JSON 解析。
+    if cursor.startswith('{"last_modified_after":"') and cursor.endswith('"}'):
+        try:
+            return parse_rfc3339_datetime(cursor[24:-2])
+        except ValueError:
+            return None
     try:
         obj = json.loads(cursor)
         if isinstance(obj, dict) and isinstance(obj.get("last_modified_after"), str):
@@ -37,20 +68,16 @@ class HuggingFaceOrgModelsSource:
     org: str
     http: HttpClient
     token: str | None = None
+    # org/token 构造后不变，请求头与首页 URL 只算一次（与 GitHub 源一致）。
+    _headers_cached: Mapping[str, str] = field(init=False, repr=False)
+    _list_url: str = field(init=False, repr=False)
 
-    def key(self) -> str:
-        return f"huggingface:{self.org}:models"
-
-    def _headers(self) -> Mapping[str, str]:
+    def __post_init__(self) -> None:
         headers: dict[str, str] = {"Accept": "application/json"}
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
-        return headers
-
-    def poll(self, cursor: str | None) -> PollResult:
-        last_modified_after = _decode_cursor(cursor)
-
-        url = with_query_params(
+        self._headers_cached = MappingProxyType(headers)
+        self._list_url = with_query_params(
             "https://huggingface.co/api/models",
             {
                 "author": self.org,
@@ -61,76 +88,114 @@ class HuggingFaceOrgModelsSource:
             },
         )
 
+    def key(self) -> str:
+        return f"huggingface:{self.org}:models"
+
+    def _headers(self) -> Mapping[str, str]:
+        return self._headers_cached
+
+    def poll(self, cursor: str | None) -> PollResult:
+        last_modified_after = _decode_cursor(cursor)
+
+        url = self._list_url
+
         newest_last_modified: datetime | None = last_modified_after
         events: list[TrackerEvent] = []
+        headers = self._headers()
+
+        # 预取流水线：拿到当前页后先根据 Link 头把下一页的请求提交到后台线程，
+        # 再解析当前页 —— 网络 RTT 与 JSON 解析/事件构造重叠，翻页耗时约减半。
+        # 命中 cursor 水位提前停止时，至多浪费一个在途请求。
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mrt-hf-prefetch") as pool:
+            future: Future | None = pool.submit(self.http.get, url, headers=headers)
+            while future is not None:
+                resp = future.result()
+                future = None
+                if resp.status == 304:
+                    # 条件请求命中缓存：该页自上次以来无变化。
+                    break
 
-        next_url: str | None = url
-        while next_url:
-            resp = self.http.get(next_url, headers=self._headers())
-            try:
-                data = resp.json()
-            except Exception as e:  # noqa: BLE001
-                body_prefix = resp.text()[:400]
-                raise ValueError(
-                    f"HuggingFace API invalid JSON: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
-                ) from e
-            if isinstance(data, dict) and isinstance(data.get("models"), list):
-                data = data["models"]
-            if not isinstance(data, list):
-                body_prefix = resp.text()[:400]
-                raise ValueError(
-                    f"HuggingFace API expected list, got {type(data)}: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
-                )
+                try:
+                    data = resp.json()
+                except Exception as e:  # noqa: BLE001
+                    body_prefix = resp.text()[:400]
+                    raise ValueError(
+                        f"HuggingFace API invalid JSON: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
+                    ) from e
+                if isinstance(data, dict) and isinstance(data.get("models"), list):
+                    data = data["models"]
+                if not isinstance(data, list):
+                    body_prefix = resp.text()[:400]
+                    raise ValueError(
+                        f"HuggingFace API expected list, got {type(data)}: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
+                    )
 
-            reached_old = False
-            for it in data:
-                if not isinstance(it, dict):
-                    continue
-                last_modified_s = it.get("lastModified") or it.get("last_modified")
-                if not isinstance(last_modified_s, str):
-                    continue
-                last_modified = parse_rfc3339_datetime(last_modified_s)
-                if last_modified_after is not None and last_modified <= last_modified_after:
-                    reached_old = True
+                # 页内按 lastModified desc 排列：末条仍新于水位才需要下一页，
+                # 这个 O(1) 检查避免发起注定无用的预取请求。
+                if not _page_reaches_cutoff(data, last_modified_after):
+                    link = resp.headers.get("Link") or resp.headers.get("link")
+                    next_url = parse_link_header(link).get("next") if link else None
+                    if next_url:
+                        future = pool.submit(self.http.get, next_url, headers=headers)
+
+                reached_old, page_newest = self._consume_page(data, events, last_modified_after)
+                if page_newest is not None and (
+                    newest_last_modified is None or page_newest > newest_last_modified
+                ):
+                    newest_last_modified = page_newest
+                if reached_old:
                     break
 
-                if newest_last_modified is None or last_modified > newest_last_modified:
-                    newest_last_modified = last_modified
-
-                model_id = str(it.get("modelId") or it.get("id") or "")
-                if not model_id:
-                    continue
-
-                title = model_id
-                url = f"https://huggingface.co/{model_id}"
-                sha = str(it.get("sha") or "")
-                event_id = sha or model_id
-                summary = str(it.get("pipeline_tag") or it.get("library_name") or "")
-
-                events.append(
-                    TrackerEvent(
-                        source="huggingface",
-                        resource_type="org_model",
-                        resource_id=self.org,
-                        event_type="model_updated",
-                        event_id=event_id,
-                        title=title,
-                        summary=summary,
-                        url=url,
-                        occurred_at=last_modified,
-                        observed_at=utc_now(),
-                        raw=it,
-                    )
-                )
+        new_cursor = _encode_cursor(newest_last_modified) if newest_last_modified is not None else cursor
+        return PollResult(events=events, new_cursor=new_cursor)
 
-            if reached_old:
+    def _consume_page(
+        self,
+        data: list[Any],
+        events: list[TrackerEvent],
+        last_modified_after: datetime | None,
+    ) -> tuple[bool, datetime | None]:
+        """解析一页记录并追加事件；返回 (是否到达 cursor 水位, 本页最新 last_modified)。"""
+        reached_old = False
+        page_newest: datetime | None = None
+        for it in data:
+            if not isinstance(it, dict):
+                continue
+            last_modified_s = it.get("lastModified") or it.get("last_modified")
+            if not isinstance(last_modified_s, str):
+                continue
+            last_modified = parse_rfc3339_datetime(last_modified_s)
+            if last_modified_after is not None and last_modified <= last_modified_after:
+                reached_old = True
                 break
 
-            link = resp.headers.get("Link") or resp.headers.get("link")
-            if not link:
-                break
-            links = parse_link_header(link)
-            next_url = links.get("next")
+            if page_newest is None or last_modified > page_newest:
+                page_newest = last_modified
+
+            model_id = str(it.get("modelId") or it.get("id") or "")
+            if not model_id:
+                continue
+
+            title = model_id
+            url = f"https://huggingface.co/{model_id}"
+            sha = str(it.get("sha") or "")
+            event_id = sha or model_id
+            summary = str(it.get("pipeline_tag") or it.get("library_name") or "")
+
+            events.append(
+                TrackerEvent(
+                    source="huggingface",
+                    resource_type="org_model",
+                    resource_id=self.org,
+                    event_type="model_updated",
+                    event_id=event_id,
+                    title=title,
+                    summary=summary,
+                    url=url,
+                    occurred_at=last_modified,
+                    observed_at=utc_now(),
+                    raw=it if _KEEP_RAW else None,
+                )
+            )
 
-        new_cursor = _encode_cursor(newest_last_modified) if newest_last_modified is not None else cursor
-        return PollResult(events=events, new_cursor=new_cursor)
+        return reached_old, page_newest
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
 import json
+import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Mapping
+from typing import Any
+
+try:  # 可选加速依赖：orjson（cursor 可含数千个 id，序列化体量不小）
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from ..http_utils import HttpClient, with_query_params
 from ..models import TrackerEvent, parse_rfc3339_datetime, utc_now
 from .base import PollResult
 
+_PAGE_SIZE = 50
+_MAX_ITEMS = 3000
+
 
 def _decode_cursor(cursor: str | None) -> set[str]:
     if not cursor:
         return set()
     try:
-        obj = json.loads(cursor)
+        obj = orjson.loads(cursor) if orjson is not None else json.loads(cursor)
         if isinstance(obj, dict) and isinstance(obj.get("known_model_ids"), list):
             return {str(x) for x in obj["known_model_ids"] if isinstance(x, str)}
         if isinstance(obj, dict) and isinstance(obj.get("known_model_paths"), list):
@@ -31,7 +41,10 @@ def _decode_cursor(cursor: str | None) -> set[str]:
 
 
 def _encode_cursor(known_model_ids: set[str]) -> str:
-    payload = {"known_model_ids": sorted(known_model_ids)}
+    # 解码端只关心成员关系（重建为 set），无需为规范化付 O(N log N) 的排序。
+    payload = {"known_model_ids": list(known_model_ids)}
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
     return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
 
 
@@ -52,84 +65,112 @@ class ModelScopeOrgModelsSource:
     def key(self) -> str:
         return f"modelscope:{self.org}:models"
 
-    def poll(self, cursor: str | None) -> PollResult:
-        known_ids = _decode_cursor(cursor)
+    def _fetch_page(self, page_number: int) -> tuple[list[Any], int | None]:
+        """拉取并校验一页，返回 (items, total_count)。"""
+        url = with_query_params(
+            "https://modelscope.cn/openapi/v1/models",
+            {
+                "owner": self.org,
+                "sort": "last_modified",
+                "page_number": str(page_number),
+                "page_size": str(_PAGE_SIZE),
+            },
+        )
+        resp = self.http.get(url, headers={"Accept": "application/json"})
+        if resp.status == 304:
+            # 条件请求命中缓存（HttpClient 透明携带 If-None-Match）：
+            # 该页自上次以来无变化，空 body 不能进 JSON 解析。
+            return [], None
+        try:
+            data = resp.json()
+        except Exception as e:  # noqa: BLE001
+            body_prefix = resp.text()[:400]
+            raise ValueError(
+                f"ModelScope OpenAPI invalid JSON: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
+            ) from e
+
+        if not isinstance(data, dict):
+            body_prefix = resp.text()[:400]
+            raise ValueError(
+                f"ModelScope OpenAPI expected object, got {type(data)}: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
+            )
 
-        page_number = 1
-        page_size = 50
-        max_items = 3000
-        found_ids: set[str] = set()
-        models: dict[str, Mapping[str, Any]] = {}
-
-        while page_number * page_size <= max_items:
-            url = with_query_params(
-                "https://modelscope.cn/openapi/v1/models",
-                {
-                    "owner": self.org,
-                    "sort": "last_modified",
-                    "page_number": str(page_number),
-                    "page_size": str(page_size),
-                },
+        data_obj = data.get("data")
+        if not (isinstance(data.get("success"), bool) and isinstance(data_obj, dict)):
+            body_prefix = resp.text()[:400]
+            raise ValueError(
+                f"ModelScope OpenAPI unexpected payload: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
             )
-            resp = self.http.get(url, headers={"Accept": "application/json"})
-            try:
-                data = resp.json()
-            except Exception as e:  # noqa: BLE001
-                body_prefix = resp.text()[:400]
-                raise ValueError(
-                    f"ModelScope OpenAPI invalid JSON: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
-                ) from e
-
-            if not isinstance(data, dict):
-                body_prefix = resp.text()[:400]
-                raise ValueError(
-                    f"ModelScope OpenAPI expected object, got {type(data)}: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
-                )
 
-            data_obj = data.get("data")
-            if not (isinstance(data.get("success"), bool) and isinstance(data_obj, dict)):
-                body_prefix = resp.text()[:400]
-                raise ValueError(
-                    f"ModelScope OpenAPI unexpected payload: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
-                )
+        items = data_obj.get("models")
+        if not isinstance(items, list):
+            body_prefix = resp.text()[:400]
+            raise ValueError(
+                f"ModelScope OpenAPI expected data.models list, got {type(items)}: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
+            )
+        total_count = data_obj.get("total_count")
+        return items, total_count if isinstance(total_count, int) else None
 
-            items = data_obj.get("models")
-            if not isinstance(items, list):
-                body_prefix = resp.text()[:400]
-                raise ValueError(
-                    f"ModelScope OpenAPI expected data.models list, got {type(items)}: status={resp.status} url={resp.url} body_prefix={body_prefix!r}"
-                )
+    def poll(self, cursor: str | None) -> PollResult:
+        known_ids = _decode_cursor(cursor)
 
-            for it in items:
-                if not isinstance(it, dict):
-                    continue
-                model_id = it.get("id")
-                if not isinstance(model_id, str) or not model_id:
-                    continue
-                found_ids.add(model_id)
-                models[model_id] = it
+        found_ids: set[str] = set()
+        # 逐页即时产出事件，而不是把全组织（最多 3000 条）的完整行暂存到
+        # dict 再统一转换：峰值内存只与“新增模型数”成正比。
+        events: list[TrackerEvent] = []
+        now = utc_now()
 
-            total_count = data_obj.get("total_count")
-            if isinstance(total_count, int) and total_count <= page_number * page_size:
-                break
-            if not items:
-                break
-            page_number += 1
+        items, total_count = self._fetch_page(1)
+        self._consume_items(items, known_ids, found_ids, events, now)
+
+        max_pages = _MAX_ITEMS // _PAGE_SIZE
+        if total_count is not None:
+            # total_count 已知：剩余页相互独立，并发拉取；顺序无所谓，
+            # 去重靠 found_ids 集合。
+            num_pages = min(math.ceil(total_count / _PAGE_SIZE), max_pages)
+            if num_pages > 1 and items:
+                pages = range(2, num_pages + 1)
+                with ThreadPoolExecutor(max_workers=min(8, len(pages))) as pool:
+                    for page_items, _ in pool.map(self._fetch_page, pages):
+                        self._consume_items(page_items, known_ids, found_ids, events, now)
+        else:
+            # total_count 缺失：退回逐页顺序扫描，空页即停。
+            page_number = 2
+            while items and page_number <= max_pages:
+                items, _ = self._fetch_page(page_number)
+                self._consume_items(items, known_ids, found_ids, events, now)
+                page_number += 1
 
-        new_ids = sorted(mid for mid in found_ids if mid not in known_ids)
+        new_cursor = _encode_cursor(known_ids | found_ids)
+        return PollResult(events=events, new_cursor=new_cursor)
 
-        events: list[TrackerEvent] = []
-        now = utc_now()
-        newest_last_modified: datetime | None = None
-        for model_id in new_ids:
-            raw = models.get(model_id) or {}
-            last_modified_s = raw.get("last_modified")
-            occurred_at = parse_rfc3339_datetime(last_modified_s) if isinstance(last_modified_s, str) else None
-            if occurred_at and (newest_last_modified is None or occurred_at > newest_last_modified):
-                newest_last_modified = occurred_at
-            tasks = raw.get("tasks")
+    def _consume_items(
+        self,
+        items: list[Any],
+        known_ids: set[str],
+        found_ids: set[str],
+        events: list[TrackerEvent],
+        now: datetime,
+    ) -> None:
+        """扫描一页记录，把未见过的模型转成 model_added 事件。"""
+        for it in items:
+            if not isinstance(it, dict):
+                continue
+            model_id = it.get("id")
+            if not isinstance(model_id, str) or not model_id:
+                continue
+            if model_id in found_ids:
+                continue
+            found_ids.add(model_id)
+            if model_id in known_ids:
+                continue
+
+            last_modified_s = it.get("last_modified")
+            occurred_at = (
+                parse_rfc3339_datetime(last_modified_s) if isinstance(last_modified_s, str) else None
+            )
+            tasks = it.get("tasks")
             summary = ",".join(str(x) for x in tasks if isinstance(x, str)) if isinstance(tasks, list) else ""
-            full_url = f"https://modelscope.cn/models/{model_id}"
             events.append(
                 TrackerEvent(
                     source="modelscope",
@@ -139,12 +180,9 @@ class ModelScopeOrgModelsSource:
                     event_id=model_id,
                     title=model_id,
                     summary=summary,
-                    url=full_url,
+                    url=f"https://modelscope.cn/models/{model_id}",
                     occurred_at=occurred_at,
                     observed_at=now,
-                    raw=raw,
+                    raw=it,
                 )
             )
-
-        new_cursor = _encode_cursor(known_ids | found_ids)
-        return PollResult(events=events, new_cursor=new_cursor)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Iterable, Mapping, Protocol, Sequence
 
 from ..models import Alert
 
@@ -19,11 +19,25 @@ class StateStore(Protocol):
 
     def set_cursor(self, source_key: str, cursor: str | None) -> None: ...
 
+    def set_cursors_bulk(self, cursors: Mapping[str, str | None]) -> None: ...
+
     def has_seen(self, fingerprint: str) -> bool: ...
 
     def mark_seen(self, fingerprint: str) -> None: ...
 
+    def check_and_mark(self, fingerprint: str) -> bool: ...
+
+    def filter_unseen(self, fingerprints: Sequence[str]) -> set[str]: ...
+
+    def mark_seen_bulk(self, fingerprints: Iterable[str]) -> None: ...
+
     def save_alert(self, alert: Alert) -> None: ...
 
+    def save_alerts_bulk(self, alerts: Sequence[Alert]) -> None: ...
+
     def record_notify_failure(self, *, fingerprint: str, channel: str, error: str) -> None: ...
 
+    def record_notify_failures_bulk(self, failures: Sequence[tuple[str, str, str]]) -> None: ...
+
+    def close(self) -> None: ...
+
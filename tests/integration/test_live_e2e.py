@@ -7,7 +7,7 @@ import threading
 import time
 import urllib.parse
 from dataclasses import dataclass
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
 import pytest
@@ -30,7 +30,7 @@ def _find_free_port() -> int:
         return int(s.getsockname()[1])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _TruncatingSource:
     """
     真实网络 source 的轻量包装器：
@@ -60,6 +60,8 @@ class _CaptureState:
     跨线程共享：收集本地 webhook server 收到的请求体。
     """
 
+    __slots__ = ("lock", "requests")
+
     def __init__(self) -> None:
         self.lock = threading.Lock()
         self.requests: list[dict] = []
@@ -69,6 +71,18 @@ class _CaptureState:
             self.requests.append(payload)
 
 
+class _ReusePortHTTPServer(ThreadingHTTPServer):
+    """
+    带 SO_REUSEPORT 的测试 server：连续用例复用同一端口时不再与
+    TIME_WAIT 状态的旧 socket 竞争 bind（SO_REUSEADDR 由基类默认开启）。
+    """
+
+    def server_bind(self) -> None:
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
 class _WeLinkHandler(BaseHTTPRequestHandler):
     """
     本地模拟 WeLink webhook：
@@ -78,52 +92,56 @@ class _WeLinkHandler(BaseHTTPRequestHandler):
     """
 
     capture: _CaptureState
+    # HTTP/1.1 + keep-alive：MRT 客户端对重复 POST 复用同一条 TCP 连接，
+    # 行为更贴近真实 webhook 服务端。
+    protocol_version = "HTTP/1.1"
+
+    def _reply_empty(self, status: int) -> None:
+        # HTTP/1.1 下必须给出 Content-Length，否则客户端会等 body 直到超时。
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
 
     def do_POST(self) -> None:  # noqa: N802
         parsed = urllib.parse.urlparse(self.path)
         qs = urllib.parse.parse_qs(parsed.query)
 
         content_len = int(self.headers.get("Content-Length") or "0")
-        raw = self.rfile.read(content_len)
-        payload = json.loads(raw.decode("utf-8"))
+        # readinto 复用预分配缓冲，省一次 bytes 拷贝；json.loads 原生吃 bytearray。
+        buf = bytearray(content_len)
+        self.rfile.readinto(buf)
+        payload = json.loads(buf)
 
         if parsed.path != "/api/werobot/v1/webhook/send":
-            self.send_response(404)
-            self.end_headers()
+            self._reply_empty(404)
             return
 
         if "token" not in qs or "channel" not in qs:
-            self.send_response(400)
-            self.end_headers()
+            self._reply_empty(400)
             return
 
         if payload.get("messageType") != "text":
-            self.send_response(400)
-            self.end_headers()
+            self._reply_empty(400)
             return
 
         text = (payload.get("content") or {}).get("text") if isinstance(payload.get("content"), dict) else None
         if not isinstance(text, str) or not (1 <= len(text) <= 500):
-            self.send_response(400)
-            self.end_headers()
+            self._reply_empty(400)
             return
 
         ts = payload.get("timeStamp")
         if not isinstance(ts, int):
-            self.send_response(400)
-            self.end_headers()
+            self._reply_empty(400)
             return
 
         now_ms = int(time.time() * 1000)
         if abs(now_ms - ts) > 10 * 60 * 1000:
-            self.send_response(400)
-            self.end_headers()
+            self._reply_empty(400)
             return
 
         u = payload.get("uuid")
         if not isinstance(u, str) or not u:
-            self.send_response(400)
-            self.end_headers()
+            self._reply_empty(400)
             return
 
         self.capture.add(payload)
@@ -132,6 +150,7 @@ class _WeLinkHandler(BaseHTTPRequestHandler):
         self.send_response(200)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
+        self.send_header("Keep-Alive", "timeout=5")
         self.end_headers()
         self.wfile.write(body)
 
@@ -139,11 +158,14 @@ class _WeLinkHandler(BaseHTTPRequestHandler):
         return
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def local_welink_server() -> dict[str, Any]:
     """
     本地模拟 WeLink webhook server（真实 HTTP server）。
 
+    module 级复用：三条用例共享同一个 server 线程与端口，省去逐用例的
+    bind/accept/shutdown；逐用例的状态隔离由下面的 autouse fixture 清理。
+
     Runner 会发起真实 HTTP POST 到该 server：
     - query 必须包含 token 与 channel
     - body 必须包含 messageType/content/timeStamp/uuid 等关键字段
@@ -154,7 +176,7 @@ def local_welink_server() -> dict[str, Any]:
 
     port = _find_free_port()
     handler = type("Handler", (_WeLinkHandler,), {"capture": capture})
-    server = HTTPServer(("127.0.0.1", port), handler)
+    server = _ReusePortHTTPServer(("127.0.0.1", port), handler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
 
@@ -166,6 +188,14 @@ def local_welink_server() -> dict[str, Any]:
         server.server_close()
 
 
+@pytest.fixture(autouse=True)
+def _reset_welink_capture(local_welink_server: dict[str, Any]) -> None:
+    """逐用例清空共享 server 的捕获记录，保持 module 级复用下的隔离。"""
+    capture: _CaptureState = local_welink_server["capture"]
+    with capture.lock:
+        capture.requests.clear()
+
+
 def test_live_poll_huggingface_posts_to_welink(local_welink_server: dict[str, Any]) -> None:
     """
     真实端到端集成测试：
@@ -1,12 +1,10 @@
-import json
-import os
 import pytest
 
-from mrt.config import load_config
+from mrt.config import load_config_from_dict
 from mrt.runner import build_runner
 
 
-def test_load_config_parses_welink_at_options(tmp_path) -> None:  # noqa: ANN001
+def test_load_config_parses_welink_at_options() -> None:
     cfg = {
         "poll_interval_seconds": 1,
         "watch_keywords": ["deepseek"],
@@ -21,10 +19,8 @@ def test_load_config_parses_welink_at_options(tmp_path) -> None:  # noqa: ANN001
             }
         },
     }
-    path = tmp_path / "config.json"
-    path.write_text(json.dumps(cfg, ensure_ascii=False), encoding="utf-8")
 
-    config = load_config(str(path))
+    config = load_config_from_dict(cfg)
     assert config.welink is not None
     assert config.welink.webhook_env == "WELINK_URL"
     assert config.welink.is_at is True
@@ -32,7 +28,7 @@ def test_load_config_parses_welink_at_options(tmp_path) -> None:  # noqa: ANN001
     assert config.welink.at_accounts == ("u1@corp", "u2@corp")
 
 
-def test_build_runner_wires_sources_and_notifiers(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_build_runner_wires_sources_and_notifiers(monkeypatch: pytest.MonkeyPatch) -> None:
     cfg = {
         "poll_interval_seconds": 1,
         "watch_keywords": ["deepseek"],
@@ -47,16 +43,13 @@ def test_build_runner_wires_sources_and_notifiers(tmp_path, monkeypatch: pytest.
         "notify": {"welink": {"webhook_env": "WELINK_URL"}},
     }
 
-    path = tmp_path / "config.json"
-    path.write_text(json.dumps(cfg, ensure_ascii=False), encoding="utf-8")
-
     monkeypatch.setenv(
         "WELINK_URL",
         "https://open.welink.huaweicloud.com/api/werobot/v1/webhook/send?token=x&channel=standard",
     )
     monkeypatch.setenv("GITHUB_TOKEN", "t")
 
-    config = load_config(str(path))
+    config = load_config_from_dict(cfg)
     runner = build_runner(config)
 
     assert len(runner.sources) == 1
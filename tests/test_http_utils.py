@@ -1,4 +1,51 @@
-from mrt.http_utils import parse_link_header, with_query_params
+import urllib.error
+from email.message import Message
+
+import pytest
+
+from mrt.http_utils import HttpClient, parse_link_header, with_query_params
+
+
+class _FakeUrlopenResponse:
+    def __init__(self, *, status: int, body: bytes, headers: dict[str, str]) -> None:
+        self.status = status
+        self._body = body
+        self.headers = Message()
+        for k, v in headers.items():
+            self.headers[k] = v
+
+    def read(self) -> bytes:
+        return self._body
+
+    def geturl(self) -> str:
+        return "https://example.test/api"
+
+    def __enter__(self) -> "_FakeUrlopenResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        return None
+
+
+def test_get_caches_etag_and_returns_304_sentinel(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = HttpClient(max_retries=0)
+    client._session = None  # noqa: SLF001  # 强制走 urllib 分支，便于打桩
+
+    def _fake_urlopen(req, timeout=None, context=None):  # noqa: ANN001, ARG001
+        if req.get_header("If-none-match") == '"tag1"':
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", Message(), None)
+        return _FakeUrlopenResponse(status=200, body=b'{"x":1}', headers={"ETag": '"tag1"'})
+
+    monkeypatch.setattr("urllib.request.urlopen", _fake_urlopen)
+
+    r1 = client.get("https://example.test/api")
+    assert r1.status == 200
+    assert r1.json() == {"x": 1}
+
+    # 第二次请求应带上缓存的 ETag，并把 304 透传为空 body 哨兵响应。
+    r2 = client.get("https://example.test/api")
+    assert r2.status == 304
+    assert r2.body == b""
 
 
 def test_parse_link_header() -> None:
@@ -8,6 +55,14 @@ def test_parse_link_header() -> None:
     assert parsed["last"] == "https://a?page=9"
 
 
+def test_parse_link_header_rel_not_first_param() -> None:
+    # RFC5988 允许 rel 不是第一个参数；正则快路径覆盖不了时必须回退逐条扫描。
+    link = '<https://a?page=2>; anchor="z"; rel="next", <https://a?page=9>; rel="last"'
+    parsed = parse_link_header(link)
+    assert parsed["next"] == "https://a?page=2"
+    assert parsed["last"] == "https://a?page=9"
+
+
 def test_with_query_params_merges() -> None:
     base = "https://example.com/api?x=1"
     url = with_query_params(base, {"x": "2", "y": "3"})
@@ -0,0 +1,86 @@
+import smtplib
+from unittest import mock
+
+import pytest
+
+from mrt.notify.email import EmailNotifier
+
+
+class _FakeSMTP:
+    """模拟 SMTP 会话：按 Subject 控制逐封成败，记录连接与发送次数。"""
+
+    connects: list["_FakeSMTP"] = []
+
+    def __init__(self, host: str, port: int, timeout: float | None = None) -> None:
+        self.sent: list[str] = []
+        _FakeSMTP.connects.append(self)
+
+    def starttls(self) -> None:
+        return None
+
+    def login(self, user: str, password: str) -> None:
+        return None
+
+    def send_message(self, msg) -> None:  # noqa: ANN001
+        subject = str(msg["Subject"])
+        if "bad" in subject:
+            raise smtplib.SMTPDataError(554, b"rejected")
+        self.sent.append(subject)
+
+    def close(self) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_smtp() -> None:
+    _FakeSMTP.connects = []
+
+
+def _notifier() -> EmailNotifier:
+    return EmailNotifier(
+        smtp_host="smtp.example.test",
+        smtp_port=587,
+        username="u@example.test",
+        password="p",
+        to_list=("a@example.test",),
+    )
+
+
+def _alert(title: str) -> mock.Mock:
+    return mock.Mock(content="text", event=mock.Mock(title=title))
+
+
+def test_connect_failure_aborts_whole_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts = {"n": 0}
+
+    def _refuse(*a, **k):  # noqa: ANN001, ARG001
+        attempts["n"] += 1
+        raise ConnectionRefusedError("refused")
+
+    monkeypatch.setattr(smtplib, "SMTP", _refuse)
+    results = _notifier().send_many([_alert("e1"), _alert("e2"), _alert("e3")])
+
+    # 连接阶段失败只付一次握手，剩余告警直接记同一个错误。
+    assert attempts["n"] == 1
+    assert len(results) == 3
+    assert all(isinstance(e, ConnectionRefusedError) for e in results)
+
+
+def test_mid_batch_failure_does_not_poison_rest(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(smtplib, "SMTP", _FakeSMTP)
+    results = _notifier().send_many([_alert("ok1"), _alert("bad"), _alert("ok2")])
+
+    assert results[0] is None
+    assert isinstance(results[1], smtplib.SMTPDataError)
+    assert results[2] is None
+    sent = [s for conn in _FakeSMTP.connects for s in conn.sent]
+    assert sent == ["[MRT] ok1", "[MRT] ok2"]
+
+
+def test_send_raises_underlying_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _refuse(*a, **k):  # noqa: ANN001, ARG001
+        raise ConnectionRefusedError("refused")
+
+    monkeypatch.setattr(smtplib, "SMTP", _refuse)
+    with pytest.raises(ConnectionRefusedError):
+        _notifier().send(_alert("e1"))
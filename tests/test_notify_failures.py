@@ -11,7 +11,7 @@ from mrt.sources.base import PollResult
 from mrt.state.sqlite_store import SqliteStateStore
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _OneShotSource:
     event: TrackerEvent
 
@@ -22,7 +22,7 @@ class _OneShotSource:
         return PollResult(events=[self.event] if cursor is None else [], new_cursor="c1")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _FailingNotifier:
     def channel(self) -> str:
         return "fail"
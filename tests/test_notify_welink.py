@@ -1,8 +1,10 @@
 import json
+from email.message import Message
 from unittest import mock
 
 import pytest
 
+from mrt.http_utils import HttpClient
 from mrt.notify.welink import WeLinkNotifier
 
 
@@ -10,16 +12,20 @@ class _FakeResponse:
     """
     模拟 urllib.request.urlopen 返回的 response 对象。
     - 支持 context manager
-    - 支持 .read() 与 .status
+    - 支持 .read()/.status/.headers/.geturl()（HttpClient.post 都会用到）
     """
 
     def __init__(self, *, status: int, body: bytes) -> None:
         self.status = status
         self._body = body
+        self.headers = Message()
 
     def read(self) -> bytes:
         return self._body
 
+    def geturl(self) -> str:
+        return "https://open.welink.huaweicloud.com/api/werobot/v1/webhook/send"
+
     def __enter__(self) -> "_FakeResponse":
         return self
 
@@ -27,6 +33,13 @@ class _FakeResponse:
         return None
 
 
+def _urllib_client() -> HttpClient:
+    """构造强制走 urllib 分支的 HttpClient，便于 monkeypatch urlopen。"""
+    client = HttpClient(max_retries=0)
+    client._session = None  # noqa: SLF001
+    return client
+
+
 def test_build_payload_aligns_with_usecase_spec(monkeypatch: pytest.MonkeyPatch) -> None:
     notifier = WeLinkNotifier(
         webhook_url="https://open.welink.huaweicloud.com/api/werobot/v1/webhook/send?token=x&channel=standard",
@@ -36,8 +49,8 @@ def test_build_payload_aligns_with_usecase_spec(monkeypatch: pytest.MonkeyPatch)
         at_accounts=("u1@corp",),
     )
 
-    monkeypatch.setattr("time.time", lambda: 100.0)
-    monkeypatch.setattr("uuid.uuid4", lambda: mock.Mock(hex="abc"))
+    monkeypatch.setattr("time.time_ns", lambda: 100_000_000_000)
+    monkeypatch.setattr("secrets.token_hex", lambda n=16: "abc")
     payload = notifier._build_payload("hello")  # noqa: SLF001
 
     assert payload["messageType"] == "text"
@@ -66,7 +79,7 @@ def test_at_all_prefix_and_flags() -> None:
 def test_send_checks_response_code(monkeypatch: pytest.MonkeyPatch) -> None:
     notifier = WeLinkNotifier(
         webhook_url="https://open.welink.huaweicloud.com/api/werobot/v1/webhook/send?token=x&channel=standard",
-        http=object(),
+        http=_urllib_client(),
     )
     ok_body = json.dumps({"code": "0", "data": "success", "message": "ok"}).encode("utf-8")
     monkeypatch.setattr("urllib.request.urlopen", lambda *a, **k: _FakeResponse(status=200, body=ok_body))
@@ -89,7 +102,7 @@ def test_send_passes_ssl_context(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("urllib.request.urlopen", _fake_urlopen)
     notifier = WeLinkNotifier(
         webhook_url="https://open.welink.huaweicloud.com/api/werobot/v1/webhook/send?token=x&channel=standard",
-        http=object(),
+        http=_urllib_client(),
     )
     notifier.send(alert=mock.Mock(content="hi"))  # type: ignore[arg-type]
     assert "context" in captured
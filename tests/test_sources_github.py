@@ -60,15 +60,9 @@ def test_issues_source_filters_out_pull_requests() -> None:
 
 
 def test_issues_source_respects_cursor_since() -> None:
+    # 与真实 API 一致：sort=updated&direction=desc，新条目在前；
+    # 到达 cursor 水位（<= updated_after）即停止扫描。
     payload = [
-        {
-            "id": 1,
-            "title": "old",
-            "body": "",
-            "html_url": "https://github.com/a/b/issues/1",
-            "updated_at": "2026-02-10T00:00:00Z",
-            "state": "open",
-        },
         {
             "id": 2,
             "title": "new",
@@ -77,6 +71,14 @@ def test_issues_source_respects_cursor_since() -> None:
             "updated_at": "2026-02-10T00:00:01Z",
             "state": "open",
         },
+        {
+            "id": 1,
+            "title": "old",
+            "body": "",
+            "html_url": "https://github.com/a/b/issues/1",
+            "updated_at": "2026-02-10T00:00:00Z",
+            "state": "open",
+        },
     ]
     base = "https://api.github.com/repos/a/b/issues"
     resp = HttpResponse(status=200, url=base, headers={}, body=json.dumps(payload).encode("utf-8"))
@@ -91,6 +93,21 @@ def test_issues_source_respects_cursor_since() -> None:
     assert [e.title for e in result.events] == ["new"]
 
 
+def test_issues_source_treats_304_as_no_change() -> None:
+    base = "https://api.github.com/repos/a/b/issues"
+    resp = HttpResponse(status=304, url=base, headers={}, body=b"")
+    http = FakeHttp(responses={base: resp})
+
+    src = GitHubRepoIssuesSource(repo="a/b", http=http, token=None)
+    cursor = json.dumps({"updated_after": "2026-02-10T00:00:00Z"})
+    result = src.poll(cursor=cursor)
+
+    assert result.events == []
+    # 水位不前移：新 cursor 与旧 cursor 表示同一时间点（序列化形式可不同）。
+    assert result.new_cursor is not None
+    assert json.loads(result.new_cursor)["updated_after"].startswith("2026-02-10T00:00:00")
+
+
 def test_pulls_source_stops_pagination_when_reaching_cursor() -> None:
     page2 = "https://api.github.com/repos/a/b/pulls?page=2"
     page1_payload = [
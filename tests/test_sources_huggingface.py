@@ -68,6 +68,21 @@ def test_accepts_wrapped_models_list() -> None:
     assert [e.title for e in result.events] == ["deepseek-ai/DeepSeek-R1"]
 
 
+def test_treats_304_as_no_change() -> None:
+    url1 = "https://huggingface.co/api/models?author=deepseek-ai&sort=lastModified&direction=-1&limit=100&full=true"
+    resp = HttpResponse(status=304, url=url1, headers={}, body=b"")
+    http = FakeHttp(responses={url1: resp})
+
+    src = HuggingFaceOrgModelsSource(org="deepseek-ai", http=http, token=None)
+    cursor = json.dumps({"last_modified_after": "2026-02-10T00:00:00Z"})
+    result = src.poll(cursor=cursor)
+
+    assert result.events == []
+    # 水位不前移：新 cursor 与旧 cursor 表示同一时间点。
+    assert result.new_cursor is not None
+    assert json.loads(result.new_cursor)["last_modified_after"].startswith("2026-02-10T00:00:00")
+
+
 def test_stops_paging_when_reaching_cursor_cutoff() -> None:
     url1 = "https://huggingface.co/api/models?author=deepseek-ai&sort=lastModified&direction=-1&limit=100&full=true"
     url2 = "https://huggingface.co/api/models?cursor=next"
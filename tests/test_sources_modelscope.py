@@ -1,3 +1,4 @@
+import json
 from dataclasses import dataclass
 
 from mrt.http_utils import HttpResponse
@@ -33,3 +34,18 @@ def test_detects_new_models_via_openapi_list() -> None:
 
     r2 = src.poll(cursor=r1.new_cursor)
     assert len(r2.events) == 0
+
+
+def test_treats_304_as_no_change() -> None:
+    url = (
+        "https://modelscope.cn/openapi/v1/models?owner=deepseek-ai&sort=last_modified&page_number=1&page_size=50"
+    )
+    http = FakeHttp(responses={url: HttpResponse(status=304, url=url, headers={}, body=b"")})
+    src = ModelScopeOrgModelsSource(org="deepseek-ai", http=http)
+
+    cursor = json.dumps({"known_model_ids": ["deepseek-ai/DeepSeek-R1"]})
+    result = src.poll(cursor=cursor)
+
+    assert result.events == []
+    # 已知模型集合不丢失：304 周期照样保留去重水位。
+    assert "deepseek-ai/DeepSeek-R1" in json.loads(result.new_cursor)["known_model_ids"]
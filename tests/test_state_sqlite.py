@@ -1,11 +1,32 @@
+import pytest
+
 from mrt.state.sqlite_store import SqliteStateStore
 
 
-def test_seen_dedupe(tmp_path) -> None:  # noqa: ANN001
-    db = tmp_path / "state.sqlite3"
-    store = SqliteStateStore(str(db))
-    store.ensure_schema()
+@pytest.fixture(scope="module")
+def store() -> SqliteStateStore:
+    """
+    module 级共享 store：建库/DDL/PRAGMA 只付一次，用例间清空数据行。
+
+    这些用例只验证去重/cursor 语义，不关心落盘，用 :memory: 免去全部
+    文件 I/O；文件 + WAL 路径由 runner/notify 的落库用例覆盖。
+    """
+    s = SqliteStateStore(":memory:")
+    s.ensure_schema()
+    yield s
+    s.close()
+
 
+@pytest.fixture(autouse=True)
+def _reset_store(store: SqliteStateStore) -> None:
+    yield
+    conn = store._connect()  # noqa: SLF001
+    with conn:
+        conn.execute("DELETE FROM seen_events")
+        conn.execute("DELETE FROM cursors")
+
+
+def test_seen_dedupe(store: SqliteStateStore) -> None:
     fp = "abc"
     assert store.has_seen(fp) is False
     store.mark_seen(fp)
@@ -15,11 +36,13 @@ def test_seen_dedupe(tmp_path) -> None:  # noqa: ANN001
     assert store.has_seen(fp) is True
 
 
-def test_cursor_roundtrip(tmp_path) -> None:  # noqa: ANN001
-    db = tmp_path / "state.sqlite3"
-    store = SqliteStateStore(str(db))
-    store.ensure_schema()
+def test_check_and_mark_reports_first_sighting(store: SqliteStateStore) -> None:
+    assert store.check_and_mark("abc") is True
+    assert store.check_and_mark("abc") is False
+    assert store.has_seen("abc") is True
+
 
+def test_cursor_roundtrip(store: SqliteStateStore) -> None:
     assert store.get_cursor("s1") is None
     store.set_cursor("s1", '{"x":1}')
     assert store.get_cursor("s1") == '{"x":1}'